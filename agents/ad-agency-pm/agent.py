@@ -12,7 +12,6 @@ import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-import yaml
 
 from shared.agents import InteractiveAgent
 from claude_agent_sdk import tool
@@ -722,8 +721,9 @@ class AdAgencyProjectManager(InteractiveAgent):
         elif action == "remove":
             # Find member by name
             member_id = None
+            name_lower = name.lower()
             for mid, member in self.team.items():
-                if member["name"].lower() == name.lower():
+                if member["name"].lower() == name_lower:
                     member_id = mid
                     break
             
@@ -1059,8 +1059,6 @@ class AdAgencyProjectManager(InteractiveAgent):
     
     async def _parallel_analysis(self, agents: List[str], task: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Run parallel analysis with multiple agents."""
-        import asyncio
-        
         tasks = []
         for agent_name in agents:
             if agent_name in self.squad_agents:
@@ -1208,13 +1206,14 @@ class AdAgencyProjectManager(InteractiveAgent):
             return {"content": [{"type": "text", "text": "Squad mode not enabled. Use --squad flag to enable multi-agent collaboration."}]}
         
         # Define which agents to include based on review scope
-        if "brief" in review_scope.lower():
+        scope_lower = review_scope.lower()
+        if "brief" in scope_lower:
             agents = ["account_manager", "strategy_planner", "creative_director"]
-        elif "creative" in review_scope.lower():
+        elif "creative" in scope_lower:
             agents = ["creative_director", "art_director", "copywriter"]
-        elif "strategy" in review_scope.lower():
+        elif "strategy" in scope_lower:
             agents = ["strategy_planner", "creative_director", "account_manager"]
-        elif "production" in review_scope.lower():
+        elif "production" in scope_lower:
             agents = ["production_manager", "creative_director", "account_manager"]
         else:
             # Full squad review
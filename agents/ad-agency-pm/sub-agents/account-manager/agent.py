@@ -6,17 +6,40 @@ Specializes in client brief analysis, requirement extraction, and client communi
 
 import asyncio
 import json
+import os
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-# Add parent directories to path for imports
+# Add the repository root (agents/ad-agency-pm/sub-agents/<name>/agent.py) to path for imports
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+_REPO_ROOT = str(Path(__file__).resolve().parents[4])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
 
 from shared.agents import InteractiveAgent
 from claude_agent_sdk import tool
 
+# Newline separator for joins inside f-strings (no backslashes allowed there)
+_NL = "\n"
+
+# Brief elements checked by validate_brief, with the keywords that signal each one
+_REQUIRED_BRIEF_ELEMENTS = {
+    "business_objectives": ("goal", "objective", "purpose", "aim"),
+    "target_audience": ("audience", "target", "demographic", "customer"),
+    "budget": ("budget", "cost", "investment", "spend"),
+    "timeline": ("timeline", "deadline", "schedule", "launch"),
+    "deliverables": ("deliverable", "output", "asset", "material"),
+    "brand_guidelines": ("brand", "logo", "style", "guideline"),
+}
+
+# One case-insensitive alternation per element, searched over the raw brief
+_BRIEF_ELEMENT_PATTERNS = {
+    element: re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    for element, keywords in _REQUIRED_BRIEF_ELEMENTS.items()
+}
+
 
 class AccountManagerAgent(InteractiveAgent):
     """Account Manager Agent specializing in brief analysis and client communication."""
@@ -36,6 +59,19 @@ class AccountManagerAgent(InteractiveAgent):
             self.create_brief_summary
         ]
     
+    def _latest_brief_analysis(self) -> Optional[Path]:
+        """Return the most recently modified brief analysis file, in one directory scan."""
+        with os.scandir(self.data_dir) as entries:
+            latest = max(
+                (
+                    entry for entry in entries
+                    if entry.name.startswith("brief_analysis_") and entry.name.endswith(".json")
+                ),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None,
+            )
+        return Path(latest.path) if latest is not None else None
+    
     @tool("analyze_brief", "Analyze client brief and extract key information", {
         "brief_content": "str",
         "client_info": "dict"
@@ -113,13 +149,13 @@ Analysis saved to: {analysis_file.name}"""
         requirement_type = args.get("requirement_type", "all")
         
         # Find analysis file
-        analysis_files = list(self.data_dir.glob("brief_analysis_*.json"))
-        if not analysis_files:
+        latest_file = self._latest_brief_analysis()
+        if latest_file is None:
             return {"content": [{"type": "text", "text": "No brief analyses found"}]}
         
         # Load most recent analysis if no specific ID provided
         if not analysis_id:
-            analysis_file = max(analysis_files, key=lambda x: x.stat().st_mtime)
+            analysis_file = latest_file
         else:
             analysis_file = self.data_dir / f"brief_analysis_{analysis_id}.json"
             if not analysis_file.exists():
@@ -236,38 +272,26 @@ Your Account Manager"""
         if not brief_content:
             return {"content": [{"type": "text", "text": "Error: Brief content is required"}]}
         
-        # Define required elements
-        required_elements = {
-            "business_objectives": ["goal", "objective", "purpose", "aim"],
-            "target_audience": ["audience", "target", "demographic", "customer"],
-            "budget": ["budget", "cost", "investment", "spend"],
-            "timeline": ["timeline", "deadline", "schedule", "launch"],
-            "deliverables": ["deliverable", "output", "asset", "material"],
-            "brand_guidelines": ["brand", "logo", "style", "guideline"]
-        }
-        
         missing_elements = []
         present_elements = []
         
-        brief_lower = brief_content.lower()
-        
-        for element, keywords in required_elements.items():
-            if any(keyword in brief_lower for keyword in keywords):
+        for element, pattern in _BRIEF_ELEMENT_PATTERNS.items():
+            if pattern.search(brief_content):
                 present_elements.append(element)
             else:
                 missing_elements.append(element)
         
-        completeness_score = len(present_elements) / len(required_elements) * 100
+        completeness_score = len(present_elements) / len(_REQUIRED_BRIEF_ELEMENTS) * 100
         
         result = f"""✅ **Brief Validation Complete**
 
 **Completeness Score:** {completeness_score:.1f}%
 
 **Present Elements:**
-{chr(10).join(f"✅ {element}" for element in present_elements)}
+{_NL.join(f"✅ {element}" for element in present_elements)}
 
 **Missing Elements:**
-{chr(10).join(f"❌ {element}" for element in missing_elements)}
+{_NL.join(f"❌ {element}" for element in missing_elements)}
 
 **Recommendations:**
 """
@@ -294,13 +318,13 @@ Your Account Manager"""
         analysis_id = args.get("analysis_id", "")
         
         # Find analysis file
-        analysis_files = list(self.data_dir.glob("brief_analysis_*.json"))
-        if not analysis_files:
+        latest_file = self._latest_brief_analysis()
+        if latest_file is None:
             return {"content": [{"type": "text", "text": "No brief analyses found"}]}
         
         # Load most recent analysis if no specific ID provided
         if not analysis_id:
-            analysis_file = max(analysis_files, key=lambda x: x.stat().st_mtime)
+            analysis_file = latest_file
         else:
             analysis_file = self.data_dir / f"brief_analysis_{analysis_id}.json"
             if not analysis_file.exists():
@@ -319,23 +343,23 @@ Your Account Manager"""
 **Date:** {analysis.get('timestamp', 'Unknown')}
 
 **Business Objectives:**
-{chr(10).join(f"• {obj}" for obj in analysis_data.get('business_objectives', []))}
+{_NL.join(f"• {obj}" for obj in analysis_data.get('business_objectives', []))}
 
 **Target Audience:**
 {json.dumps(analysis_data.get('target_audience', {}), indent=2)}
 
 **Key Messages:**
-{chr(10).join(f"• {msg}" for msg in analysis_data.get('key_messages', []))}
+{_NL.join(f"• {msg}" for msg in analysis_data.get('key_messages', []))}
 
 **Deliverables:**
-{chr(10).join(f"• {deliverable}" for deliverable in analysis_data.get('deliverables', []))}
+{_NL.join(f"• {deliverable}" for deliverable in analysis_data.get('deliverables', []))}
 
 **Constraints:**
 - Budget: {analysis_data.get('constraints', {}).get('budget', 'Not specified')}
 - Timeline: {analysis_data.get('constraints', {}).get('timeline', 'Not specified')}
 
 **Success Metrics:**
-{chr(10).join(f"• {metric}" for metric in analysis_data.get('success_metrics', []))}
+{_NL.join(f"• {metric}" for metric in analysis_data.get('success_metrics', []))}
 
 **Questions for Clarification:**
 {len(analysis.get('questions_for_clarification', []))} items identified
@@ -10,13 +10,18 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-# Add parent directories to path for imports
+# Add the repository root (agents/ad-agency-pm/sub-agents/<name>/agent.py) to path for imports
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+_REPO_ROOT = str(Path(__file__).resolve().parents[4])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
 
 from shared.agents import InteractiveAgent
 from claude_agent_sdk import tool
 
+# Newline separator for joins inside f-strings (no backslashes allowed there)
+_NL = "\n"
+
 
 class CopywriterAgent(InteractiveAgent):
     """Copywriter Agent specializing in messaging and copy creation."""
@@ -311,10 +316,10 @@ Tone of voice saved to: {tone_file.name}"""
 - Audience Appropriateness: {review['review_results']['audience_appropriateness_score']}/10
 
 **Strengths:**
-{chr(10).join(f"• {strength}" for strength in review['strengths'])}
+{_NL.join(f"• {strength}" for strength in review['strengths'])}
 
 **Areas for Improvement:**
-{chr(10).join(f"• {area}" for area in review['areas_for_improvement'])}
+{_NL.join(f"• {area}" for area in review['areas_for_improvement'])}
 
 **Detailed Feedback:**
 {len(review['detailed_feedback'])} feedback points provided
@@ -375,7 +380,7 @@ Review saved to: {review_file.name}"""
 **Target Platforms:** {', '.join(target_platforms)}
 
 **Platform Adaptations:**
-{chr(10).join(f"• {platform.title()}: Adapted" for platform in target_platforms)}
+{_NL.join(f"• {platform.title()}: Adapted" for platform in target_platforms)}
 
 **Optimization Notes:**
 {len(adaptations['optimization_notes'])} optimization notes
@@ -10,13 +10,18 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-# Add parent directories to path for imports
+# Add the repository root (agents/ad-agency-pm/sub-agents/<name>/agent.py) to path for imports
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+_REPO_ROOT = str(Path(__file__).resolve().parents[4])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
 
 from shared.agents import InteractiveAgent
 from claude_agent_sdk import tool
 
+# Newline separator for joins inside f-strings (no backslashes allowed there)
+_NL = "\n"
+
 
 class CreativeDirectorAgent(InteractiveAgent):
     """Creative Director Agent specializing in creative strategy and vision."""
@@ -204,7 +209,7 @@ Synthesis saved to: {synthesis_file.name}"""
 **Review Date:** {approval['timestamp']}
 
 **Evaluation Criteria:**
-{chr(10).join(f"• {criterion}" for criterion in approval_criteria)}
+{_NL.join(f"• {criterion}" for criterion in approval_criteria)}
 
 **Overall Assessment:**
 - Status: {approval['approval_status'].title()}
@@ -336,10 +341,10 @@ Brief saved to: {brief_file.name}"""
 {review['review_results']['overall_assessment']}
 
 **Strengths:**
-{chr(10).join(f"• {strength}" for strength in review['review_results']['strengths'])}
+{_NL.join(f"• {strength}" for strength in review['review_results']['strengths'])}
 
 **Areas for Improvement:**
-{chr(10).join(f"• {area}" for area in review['review_results']['areas_for_improvement'])}
+{_NL.join(f"• {area}" for area in review['review_results']['areas_for_improvement'])}
 
 **Detailed Feedback:**
 {len(review['detailed_feedback'])} feedback points provided
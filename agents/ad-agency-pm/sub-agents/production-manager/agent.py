@@ -8,11 +8,13 @@ import asyncio
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# Add parent directories to path for imports
+# Add the repository root (agents/ad-agency-pm/sub-agents/<name>/agent.py) to path for imports
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+_REPO_ROOT = str(Path(__file__).resolve().parents[4])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
 
 from shared.agents import InteractiveAgent
 from claude_agent_sdk import tool
@@ -10,11 +10,13 @@ import sys
 from pathlib import Path
 from typing import List, Any, Optional
 
-# Add the shared modules to the path
-sys.path.append(str(Path(__file__).parent.parent.parent / "shared"))
+# Add the project root to the path (once, even if this module is re-imported)
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-from agents import BaseClaudeAgent, InteractiveAgent
-from utils import setup_logging
+from shared.agents import BaseClaudeAgent, InteractiveAgent
+from shared.utils import setup_logging
 from claude_agent_sdk import tool
 
 
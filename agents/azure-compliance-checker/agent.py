@@ -8,50 +8,28 @@ ISO 27001, DORA, and NIS2.
 
 import asyncio
 import json
+import os
+import re
+import subprocess
 import sys
 import yaml
 from pathlib import Path
-from typing import List, Any, Optional, Dict
+from types import MappingProxyType
+from typing import List, Any, Optional, Dict, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-# Add the shared modules to the path
-sys.path.append(str(Path(__file__).parent.parent.parent / "shared"))
+# Add the project root to the path (once, even if this module is re-imported)
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-from agents import InteractiveAgent
-from utils import setup_logging
+from shared.agents import InteractiveAgent
+from shared.utils import setup_logging
 from claude_agent_sdk import tool
 
-
-class AzureComplianceAgent(InteractiveAgent):
-    """
-    Azure Compliance Checker agent.
-
-    This agent validates Azure infrastructure against compliance controls:
-    - Load user-defined compliance checklists (YAML)
-    - Validate Azure resources against control requirements
-    - Generate compliance reports with evidence
-    - Identify gaps and remediation steps
-    - Support for French FSI regulations
-    """
-
-    def __init__(self, config_dir: Path):
-        super().__init__(config_dir)
-        self.checklists_dir = config_dir / "checklists"
-        self.reports_dir = config_dir / "reports"
-
-        # Ensure directories exist
-        self.checklists_dir.mkdir(exist_ok=True)
-        self.reports_dir.mkdir(exist_ok=True)
-
-        # Compliance state
-        self.current_checklist = None
-        self.compliance_results = []
-        self.last_scan_time = None
-
-    def get_system_prompt(self) -> Optional[str]:
-        """Get the system prompt for this agent."""
-        return """You are an Azure Compliance and Audit expert specializing in French Financial Services regulations.
+# Returned by get_system_prompt
+_SYSTEM_PROMPT = """You are an Azure Compliance and Audit expert specializing in French Financial Services regulations.
 
 You help organizations validate their Azure infrastructure against compliance requirements including:
 
@@ -86,6 +64,73 @@ You prioritize:
 - Regulatory audit readiness
 """
 
+# Status markers written by _validate_single_control, found in a single pass
+_MANUAL_MARKER = "Manual Verification Required"
+_PASSED_MARKER = "Status**: PASSED"
+_STATUS_MARKERS = re.compile(f"{re.escape(_MANUAL_MARKER)}|{re.escape(_PASSED_MARKER)}")
+
+# Upper bound on `az resource list` processes running at once
+_MAX_CONCURRENT_AZ_QUERIES = 4
+
+# Footer of load_compliance_checklist
+_NEXT_STEPS_TEXT = (
+    "\n💡 Next steps:\n"
+    "   - Use validate_all_controls to check all controls\n"
+    "   - Use validate_control to check a specific control\n"
+    "   - Use generate_compliance_report to create a report\n"
+)
+
+# Precondition failures shared by several tools. The SDK only reads tool
+# results, so one read-only response is returned on every call.
+_NO_CHECKLIST_RESPONSE = MappingProxyType({
+    "content": (
+        MappingProxyType({"type": "text", "text": "❌ No checklist loaded. Use load_compliance_checklist first."}),
+    )
+})
+
+_NO_RESULTS_RESPONSE = MappingProxyType({
+    "content": (
+        MappingProxyType({"type": "text", "text": "❌ No validation results. Run validate_all_controls first."}),
+    )
+})
+
+
+class AzureComplianceAgent(InteractiveAgent):
+    """
+    Azure Compliance Checker agent.
+
+    This agent validates Azure infrastructure against compliance controls:
+    - Load user-defined compliance checklists (YAML)
+    - Validate Azure resources against control requirements
+    - Generate compliance reports with evidence
+    - Identify gaps and remediation steps
+    - Support for French FSI regulations
+    """
+
+    def __init__(self, config_dir: Path):
+        super().__init__(config_dir)
+        self.checklists_dir = config_dir / "checklists"
+        self.reports_dir = config_dir / "reports"
+
+        # Ensure directories exist
+        self.checklists_dir.mkdir(exist_ok=True)
+        self.reports_dir.mkdir(exist_ok=True)
+
+        # Compliance state
+        self.current_checklist = None
+        self.compliance_results = []
+        self.last_scan_time = None
+
+        # Bounds concurrent `az resource list` processes during a full scan
+        self._az_query_slots = asyncio.Semaphore(_MAX_CONCURRENT_AZ_QUERIES)
+
+        # Parsed checklists keyed by path, with the (mtime_ns, size) they were read at
+        self._checklist_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+    def get_system_prompt(self) -> Optional[str]:
+        """Get the system prompt for this agent."""
+        return _SYSTEM_PROMPT
+
     def get_custom_tools(self) -> List[Any]:
         """Get custom tools for this agent."""
         return [
@@ -101,10 +146,40 @@ You prioritize:
             self.validate_custom_control,
         ]
 
+    def _find_checklists(self) -> List[Path]:
+        """Return the YAML checklists (*.yaml, *.yml) using a single directory scan."""
+        with os.scandir(self.checklists_dir) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(('.yaml', '.yml')) and entry.is_file()
+            )
+
+    def _read_checklist(self, checklist_path: Path) -> Dict[str, Any]:
+        """
+        Parse a checklist file (blocking; run it via asyncio.to_thread).
+
+        The parsed checklist is reused until the file's mtime or size changes.
+        """
+        stat = checklist_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._checklist_cache.get(checklist_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(checklist_path, 'r') as f:
+            data = yaml.safe_load(f)
+        self._checklist_cache[checklist_path] = (signature, data)
+        return data
+
+    def _count_controls(self, checklist_path: Path) -> int:
+        """Return the number of controls in a checklist file."""
+        return len(self._read_checklist(checklist_path).get('checklist', []))
+
     @tool("list_available_checklists", "List available compliance checklists", {})
     async def list_available_checklists(self, args):
         """List all available compliance checklists."""
-        checklists = list(self.checklists_dir.glob("*.yaml")) + list(self.checklists_dir.glob("*.yml"))
+        checklists = self._find_checklists()
 
         if not checklists:
             return {
@@ -113,19 +188,20 @@ You prioritize:
                 ]
             }
 
-        checklist_text = "📋 Available Compliance Checklists:\n\n"
-        for i, checklist_path in enumerate(checklists, 1):
-            # Load and parse to get metadata
-            try:
-                with open(checklist_path, 'r') as f:
-                    data = yaml.safe_load(f)
-                    controls_count = len(data.get('checklist', []))
+        # Load and parse every checklist concurrently to get metadata
+        counts = await asyncio.gather(
+            *(asyncio.to_thread(self._count_controls, path) for path in checklists),
+            return_exceptions=True,
+        )
 
+        checklist_text = "📋 Available Compliance Checklists:\n\n"
+        for i, (checklist_path, controls_count) in enumerate(zip(checklists, counts), 1):
+            if isinstance(controls_count, Exception):
+                checklist_text += f"{i}. **{checklist_path.name}** (Error loading: {str(controls_count)})\n\n"
+            else:
                 checklist_text += f"{i}. **{checklist_path.name}**\n"
                 checklist_text += f"   • Controls: {controls_count}\n"
                 checklist_text += f"   • Path: {checklist_path}\n\n"
-            except Exception as e:
-                checklist_text += f"{i}. **{checklist_path.name}** (Error loading: {str(e)})\n\n"
 
         return {
             "content": [
@@ -147,8 +223,7 @@ You prioritize:
             }
 
         try:
-            with open(checklist_path, 'r') as f:
-                self.current_checklist = yaml.safe_load(f)
+            self.current_checklist = await asyncio.to_thread(self._read_checklist, checklist_path)
 
             controls = self.current_checklist.get('checklist', [])
 
@@ -167,10 +242,7 @@ You prioritize:
                 count = sum(1 for c in controls if c.get('reglementation') == reg)
                 result_text += f"   • {reg}: {count} controls\n"
 
-            result_text += "\n💡 Next steps:\n"
-            result_text += "   - Use validate_all_controls to check all controls\n"
-            result_text += "   - Use validate_control to check a specific control\n"
-            result_text += "   - Use generate_compliance_report to create a report\n"
+            result_text += _NEXT_STEPS_TEXT
 
             return {
                 "content": [
@@ -189,11 +261,7 @@ You prioritize:
     async def validate_control(self, args):
         """Validate a specific compliance control."""
         if not self.current_checklist:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ No checklist loaded. Use load_compliance_checklist first."}
-                ]
-            }
+            return _NO_CHECKLIST_RESPONSE
 
         control_index = args.get("control_index", 0)
         controls = self.current_checklist.get('checklist', [])
@@ -214,10 +282,30 @@ You prioritize:
             ]
         }
 
-    async def _validate_single_control(self, control: Dict, index: int) -> str:
-        """Validate a single control against Azure resources."""
-        import subprocess
+    async def _run_resource_query(self, resource_type: str):
+        """Run `az resource list` for a resource type in a worker thread."""
+        query = f"az resource list --resource-type {resource_type} --output json"
+        async with self._az_query_slots:
+            return await asyncio.to_thread(
+                subprocess.run,
+                query.split(),
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
 
+    async def _validate_single_control(
+        self,
+        control: Dict,
+        index: int,
+        resource_queries: Optional[Dict[str, "asyncio.Future"]] = None,
+    ) -> str:
+        """
+        Validate a single control against Azure resources.
+
+        When validating several controls, pass a shared ``resource_queries``
+        dict so each resource type is queried from Azure only once.
+        """
         result_text = f"\n{'='*80}\n"
         result_text += f"Control #{index + 1}\n"
         result_text += f"{'='*80}\n\n"
@@ -253,13 +341,14 @@ You prioritize:
 
             # Query Azure for resources using Azure CLI
             try:
-                query = f"az resource list --resource-type {resource_type} --output json"
-                result = subprocess.run(
-                    query.split(),
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+                if resource_queries is None:
+                    result = await self._run_resource_query(resource_type)
+                else:
+                    if resource_type not in resource_queries:
+                        resource_queries[resource_type] = asyncio.ensure_future(
+                            self._run_resource_query(resource_type)
+                        )
+                    result = await resource_queries[resource_type]
 
                 if result.returncode != 0:
                     if required:
@@ -326,11 +415,7 @@ You prioritize:
     async def validate_all_controls(self, args):
         """Validate all compliance controls."""
         if not self.current_checklist:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ No checklist loaded. Use load_compliance_checklist first."}
-                ]
-            }
+            return _NO_CHECKLIST_RESPONSE
 
         controls = self.current_checklist.get('checklist', [])
 
@@ -344,14 +429,19 @@ You prioritize:
 
         self.compliance_results = []
 
-        for i, control in enumerate(controls):
-            validation_result = await self._validate_single_control(control, i)
+        # Validate all controls concurrently, querying each resource type once
+        resource_queries: Dict[str, asyncio.Future] = {}
+        validation_results = await asyncio.gather(
+            *(self._validate_single_control(control, i, resource_queries) for i, control in enumerate(controls))
+        )
 
+        for i, (control, validation_result) in enumerate(zip(controls, validation_results)):
             # Determine status
-            if "Manual Verification Required" in validation_result:
+            markers = set(_STATUS_MARKERS.findall(validation_result))
+            if _MANUAL_MARKER in markers:
                 status = "MANUAL"
                 manual += 1
-            elif "Status**: PASSED" in validation_result:
+            elif _PASSED_MARKER in markers:
                 status = "PASSED"
                 passed += 1
             else:
@@ -394,8 +484,6 @@ You prioritize:
     @tool("check_azure_resource", "Check if a specific Azure resource type exists", {"resource_type": str})
     async def check_azure_resource(self, args):
         """Check for specific Azure resources."""
-        import subprocess
-
         resource_type = args.get("resource_type", "")
 
         if not resource_type:
@@ -463,36 +551,31 @@ You prioritize:
     async def generate_compliance_report(self, args):
         """Generate a detailed compliance report."""
         if not self.compliance_results:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ No validation results. Run validate_all_controls first."}
-                ]
-            }
+            return _NO_RESULTS_RESPONSE
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock read so the filename, report and summary agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         report_path = self.reports_dir / f"compliance_report_{timestamp}.md"
 
         # Generate report content
-        report = self._generate_report_content()
+        report = self._generate_report_content(now)
 
         # Save to file
-        with open(report_path, 'w') as f:
-            f.write(report)
+        await asyncio.to_thread(report_path.write_text, report)
 
         result_text = f"✅ Compliance report generated:\n\n"
         result_text += f"📄 File: {report_path}\n"
-        result_text += f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        result_text += f"📅 Date: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
         result_text += f"📊 Controls: {len(self.compliance_results)}\n\n"
 
         # Summary statistics
-        passed = sum(1 for r in self.compliance_results if r['status'] == 'PASSED')
-        failed = sum(1 for r in self.compliance_results if r['status'] == 'FAILED')
-        manual = sum(1 for r in self.compliance_results if r['status'] == 'MANUAL')
+        status_counts = Counter(r['status'] for r in self.compliance_results)
 
         result_text += f"Summary:\n"
-        result_text += f"   ✅ Passed: {passed}\n"
-        result_text += f"   ❌ Failed: {failed}\n"
-        result_text += f"   ⚠️  Manual: {manual}\n"
+        result_text += f"   ✅ Passed: {status_counts['PASSED']}\n"
+        result_text += f"   ❌ Failed: {status_counts['FAILED']}\n"
+        result_text += f"   ⚠️  Manual: {status_counts['MANUAL']}\n"
 
         return {
             "content": [
@@ -500,59 +583,61 @@ You prioritize:
             ]
         }
 
-    def _generate_report_content(self) -> str:
+    def _generate_report_content(self, now: Optional[datetime] = None) -> str:
         """Generate markdown report content."""
-        report = f"# Azure Compliance Report\n\n"
-        report += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        now = now or datetime.now()
 
         # Executive Summary
-        passed = sum(1 for r in self.compliance_results if r['status'] == 'PASSED')
-        failed = sum(1 for r in self.compliance_results if r['status'] == 'FAILED')
-        manual = sum(1 for r in self.compliance_results if r['status'] == 'MANUAL')
+        status_counts = Counter(r['status'] for r in self.compliance_results)
+        passed = status_counts['PASSED']
+        failed = status_counts['FAILED']
+        manual = status_counts['MANUAL']
         total = len(self.compliance_results)
 
-        report += "## Executive Summary\n\n"
-        report += f"- **Total Controls**: {total}\n"
-        report += f"- **Passed**: {passed} ({(passed/total*100):.1f}%)\n"
-        report += f"- **Failed**: {failed} ({(failed/total*100):.1f}%)\n"
-        report += f"- **Manual Review**: {manual} ({(manual/total*100):.1f}%)\n\n"
+        parts = [
+            "# Azure Compliance Report\n\n"
+            f"**Generated**: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            "## Executive Summary\n\n"
+            f"- **Total Controls**: {total}\n"
+            f"- **Passed**: {passed} ({(passed/total*100):.1f}%)\n"
+            f"- **Failed**: {failed} ({(failed/total*100):.1f}%)\n"
+            f"- **Manual Review**: {manual} ({(manual/total*100):.1f}%)\n\n"
+        ]
 
         # Group by regulation
         by_regulation = defaultdict(list)
         for result in self.compliance_results:
             by_regulation[result['regulation']].append(result)
 
-        report += "## Compliance by Regulation\n\n"
+        parts.append("## Compliance by Regulation\n\n")
         for regulation, results in sorted(by_regulation.items()):
             reg_passed = sum(1 for r in results if r['status'] == 'PASSED')
             reg_total = len(results)
-            report += f"### {regulation}\n\n"
-            report += f"- **Compliance Rate**: {(reg_passed/reg_total*100):.1f}%\n"
-            report += f"- **Passed**: {reg_passed}/{reg_total}\n\n"
+            parts.append(
+                f"### {regulation}\n\n"
+                f"- **Compliance Rate**: {(reg_passed/reg_total*100):.1f}%\n"
+                f"- **Passed**: {reg_passed}/{reg_total}\n\n"
+            )
 
         # Detailed Results
-        report += "## Detailed Results\n\n"
+        parts.append("## Detailed Results\n\n")
         for result in self.compliance_results:
             status_icon = "✅" if result['status'] == 'PASSED' else ("❌" if result['status'] == 'FAILED' else "⚠️")
-            report += f"### {status_icon} Control #{result['index'] + 1}: {result['requirement']}\n\n"
-            report += f"**Regulation**: {result['regulation']}\n\n"
-            report += f"**Status**: {result['status']}\n\n"
-            report += "```\n"
-            report += result['details']
-            report += "\n```\n\n"
-            report += "---\n\n"
+            parts.append(
+                f"### {status_icon} Control #{result['index'] + 1}: {result['requirement']}\n\n"
+                f"**Regulation**: {result['regulation']}\n\n"
+                f"**Status**: {result['status']}\n\n"
+                f"```\n{result['details']}\n```\n\n"
+                "---\n\n"
+            )
 
-        return report
+        return "".join(parts)
 
     @tool("get_compliance_summary", "Get summary of compliance results", {})
     async def get_compliance_summary(self, args):
         """Get compliance summary."""
         if not self.compliance_results:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ No validation results. Run validate_all_controls first."}
-                ]
-            }
+            return _NO_RESULTS_RESPONSE
 
         # Group by regulation
         by_regulation = defaultdict(lambda: {'passed': 0, 'failed': 0, 'manual': 0})
@@ -592,11 +677,7 @@ You prioritize:
     async def get_remediation_plan(self, args):
         """Get remediation plan for failed controls."""
         if not self.compliance_results:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ No validation results. Run validate_all_controls first."}
-                ]
-            }
+            return _NO_RESULTS_RESPONSE
 
         failed_controls = [r for r in self.compliance_results if r['status'] == 'FAILED']
 
@@ -607,19 +688,21 @@ You prioritize:
                 ]
             }
 
-        remediation_text = f"🔧 Remediation Plan ({len(failed_controls)} Failed Controls)\n\n"
-
-        for i, result in enumerate(failed_controls, 1):
-            remediation_text += f"{i}. **{result['regulation']}**: {result['requirement']}\n"
-            remediation_text += f"   Priority: HIGH\n"
-            remediation_text += f"   Action: Review control details and implement required Azure resources\n\n"
-
-        remediation_text += "\n💡 Recommended Actions:\n"
-        remediation_text += "1. Review each failed control's requirements\n"
-        remediation_text += "2. Deploy missing Azure resources\n"
-        remediation_text += "3. Configure Azure Policy assignments\n"
-        remediation_text += "4. Enable security features (Defender, Sentinel, etc.)\n"
-        remediation_text += "5. Re-run validation after remediation\n"
+        remediation_text = (
+            f"🔧 Remediation Plan ({len(failed_controls)} Failed Controls)\n\n"
+            + "".join(
+                f"{i}. **{result['regulation']}**: {result['requirement']}\n"
+                "   Priority: HIGH\n"
+                "   Action: Review control details and implement required Azure resources\n\n"
+                for i, result in enumerate(failed_controls, 1)
+            )
+            + "\n💡 Recommended Actions:\n"
+            "1. Review each failed control's requirements\n"
+            "2. Deploy missing Azure resources\n"
+            "3. Configure Azure Policy assignments\n"
+            "4. Enable security features (Defender, Sentinel, etc.)\n"
+            "5. Re-run validation after remediation\n"
+        )
 
         return {
             "content": [
@@ -633,17 +716,14 @@ You prioritize:
         output_format = args.get("format", "markdown").lower()
 
         if not self.compliance_results:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ No validation results. Run validate_all_controls first."}
-                ]
-            }
+            return _NO_RESULTS_RESPONSE
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
 
         if output_format == "markdown":
             filename = f"audit_report_{timestamp}.md"
-            content = self._generate_report_content()
+            content = self._generate_report_content(now)
         elif output_format == "json":
             filename = f"audit_report_{timestamp}.json"
             content = json.dumps({
@@ -659,13 +739,12 @@ You prioritize:
             }
 
         report_path = self.reports_dir / filename
-        with open(report_path, 'w') as f:
-            f.write(content)
+        await asyncio.to_thread(report_path.write_text, content)
 
         result_text = f"✅ Audit report exported:\n\n"
         result_text += f"📄 File: {report_path}\n"
         result_text += f"📊 Format: {output_format.upper()}\n"
-        result_text += f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        result_text += f"📅 Date: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
 
         return {
             "content": [
@@ -702,6 +781,34 @@ You prioritize:
             }
 
 
+# Startup banner printed by main(), assembled once
+_BANNER = (
+    f"\n{'=' * 80}\n"
+    "  📋 AZURE COMPLIANCE CHECKER AGENT\n"
+    f"{'=' * 80}\n"
+    "\n🎯 Capabilities:\n"
+    "   • Load compliance checklists (YAML)\n"
+    "   • Validate Azure resources against controls\n"
+    "   • Generate compliance reports with evidence\n"
+    "   • Identify gaps and remediation steps\n"
+    "   • Support for French FSI regulations\n"
+    "\n📜 Supported Regulations:\n"
+    "   • ACPR (Gouvernance SI)\n"
+    "   • CRD IV / CRR (Capital Requirements)\n"
+    "   • LCB-FT / AMLD5 (Anti-Money Laundering)\n"
+    "   • RGPD / CNIL (GDPR)\n"
+    "   • ISO 27001 / SOC 2\n"
+    "   • DORA (Digital Resilience)\n"
+    "   • NIS2 (Network Security)\n"
+    "\n💬 Try asking me to:\n"
+    "   - List available checklists\n"
+    "   - Load the french-fsi-regulations checklist\n"
+    "   - Validate all controls\n"
+    "   - Generate a compliance report\n"
+    "   - Get remediation plan\n"
+)
+
+
 async def main():
     """
     Main entry point for the Azure Compliance Checker agent.
@@ -720,29 +827,7 @@ async def main():
     # Create and run the agent
     agent = AzureComplianceAgent(config_dir)
 
-    print("\n" + "="*80)
-    print("  📋 AZURE COMPLIANCE CHECKER AGENT")
-    print("="*80)
-    print("\n🎯 Capabilities:")
-    print("   • Load compliance checklists (YAML)")
-    print("   • Validate Azure resources against controls")
-    print("   • Generate compliance reports with evidence")
-    print("   • Identify gaps and remediation steps")
-    print("   • Support for French FSI regulations")
-    print("\n📜 Supported Regulations:")
-    print("   • ACPR (Gouvernance SI)")
-    print("   • CRD IV / CRR (Capital Requirements)")
-    print("   • LCB-FT / AMLD5 (Anti-Money Laundering)")
-    print("   • RGPD / CNIL (GDPR)")
-    print("   • ISO 27001 / SOC 2")
-    print("   • DORA (Digital Resilience)")
-    print("   • NIS2 (Network Security)")
-    print("\n💬 Try asking me to:")
-    print("   - List available checklists")
-    print("   - Load the french-fsi-regulations checklist")
-    print("   - Validate all controls")
-    print("   - Generate a compliance report")
-    print("   - Get remediation plan")
+    sys.stdout.write(_BANNER)
 
     await agent.run_interactive()
 
@@ -9,10 +9,17 @@ Landing Zones using:
 """
 
 import asyncio
+import functools
 import json
+import os
+import re
+import subprocess
 import sys
+import time
 import argparse
+from collections import ChainMap
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Any, Optional, Dict
 from datetime import datetime
 from dotenv import load_dotenv
@@ -21,14 +28,905 @@ import yaml
 # Load environment variables from .env file
 load_dotenv(Path(__file__).parent / ".env")
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add the project root to the path (once, even if this module is re-imported)
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from shared.agents import InteractiveAgent
 from shared.utils import setup_logging
 from claude_agent_sdk import tool, AssistantMessage, TextBlock
 
 
+# ============================================================================
+# STATIC TEMPLATES
+# ============================================================================
+# Built once at import time; tools only substitute the configuration values.
+
+# Shared read-only default for missing config sections (avoids a new {} per lookup).
+# Sections kept on the agent in __init__ default to {} because the JSON plan serializes them.
+_EMPTY = MappingProxyType({})
+
+# Line prefixes shared by the text reports.
+_BULLET = "   • "
+_CHECK = "   ✓ "
+_SUB_ITEM = "      - "
+
+_NETWORK_SECURITY_CONTROLS_TEXT = (
+    "\n🔒 Security Controls:\n"
+    f"{_BULLET}Network Security Groups on all subnets\n"
+    f"{_BULLET}Azure Firewall for traffic inspection\n"
+    f"{_BULLET}Private endpoints for PaaS services\n"
+    f"{_BULLET}No public IP addresses (FSI compliance)\n"
+    f"{_BULLET}DDoS Protection Standard\n"
+)
+
+_DATA_RESIDENCY_REQUIREMENTS_TEXT = (
+    "\n🔒 Compliance Requirements:\n"
+    f"{_BULLET}GDPR: Data stored within EU/EEA\n"
+    f"{_BULLET}Data sovereignty: Government access limited\n"
+    f"{_BULLET}Cross-border transfers: Prohibited outside EU\n"
+    f"{_BULLET}Backup locations: EU regions only\n"
+    "\n💡 Azure Policy:\n"
+    "   Policy will DENY resource creation in non-EU regions\n"
+    "   Exemptions require compliance review and approval\n"
+)
+
+# Display names for the EU regions allowed by the data residency policy.
+_REGION_DETAILS = MappingProxyType({
+    "westeurope": "Netherlands (West Europe)",
+    "northeurope": "Ireland (North Europe)",
+    "francecentral": "France (France Central)",
+    "germanywestcentral": "Germany (Germany West Central)"
+})
+
+# Requirements and Azure controls per regulation, for get_fsi_compliance_requirements.
+_FSI_COMPLIANCE_DETAILS = {
+    "GDPR": {
+        "name": "General Data Protection Regulation",
+        "key_requirements": [
+            "Data residency within EU/EEA",
+            "Encryption of personal data at rest and in transit",
+            "Right to erasure (right to be forgotten)",
+            "Data breach notification within 72 hours",
+            "Privacy by design and by default",
+            "Data protection impact assessments (DPIA)"
+        ],
+        "azure_controls": [
+            "Azure Policy: Allowed locations for resources",
+            "Azure Key Vault with customer-managed keys",
+            "Azure Private Link for services",
+            "Microsoft Defender for Cloud",
+            "Azure Information Protection"
+        ]
+    },
+    "DORA": {
+        "name": "Digital Operational Resilience Act",
+        "key_requirements": [
+            "ICT risk management framework",
+            "Incident reporting mechanisms",
+            "Digital operational resilience testing",
+            "Third-party ICT service provider management",
+            "Information sharing on cyber threats"
+        ],
+        "azure_controls": [
+            "Azure Backup and Site Recovery",
+            "Azure Monitor and Log Analytics",
+            "Business continuity planning tools",
+            "Resilience testing framework",
+            "Multi-region deployment architecture"
+        ]
+    },
+    "PSD2": {
+        "name": "Payment Services Directive 2",
+        "key_requirements": [
+            "Strong customer authentication (SCA)",
+            "Secure communication channels",
+            "Transaction monitoring",
+            "API security for open banking",
+            "Fraud detection and prevention"
+        ],
+        "azure_controls": [
+            "Azure AD Multi-Factor Authentication",
+            "Azure API Management with OAuth 2.0",
+            "Azure Application Gateway with WAF",
+            "Azure Sentinel for security analytics",
+            "Azure Key Vault for credential management"
+        ]
+    },
+    "MiFID_II": {
+        "name": "Markets in Financial Instruments Directive II",
+        "key_requirements": [
+            "Transaction reporting",
+            "Record keeping and audit trails",
+            "Best execution reporting",
+            "Clock synchronization",
+            "Data retention (5-7 years)"
+        ],
+        "azure_controls": [
+            "Azure Storage with immutable blobs",
+            "Azure Log Analytics with retention policies",
+            "Azure Time Series Insights",
+            "Azure Purview for data governance",
+            "Azure Archive Storage"
+        ]
+    },
+    "EBA_GL": {
+        "name": "European Banking Authority Guidelines",
+        "key_requirements": [
+            "ICT and security risk management",
+            "Outsourcing arrangements",
+            "Cloud service provider oversight",
+            "Exit strategies from cloud services",
+            "Operational resilience"
+        ],
+        "azure_controls": [
+            "Azure Resource Manager for governance",
+            "Azure Policy for compliance enforcement",
+            "Data export and portability tools",
+            "Multi-cloud and hybrid capabilities",
+            "Sovereign cloud options (Azure Germany, etc.)"
+        ]
+    }
+}
+
+# One get_fsi_compliance_requirements section per regulation, rendered once.
+_FSI_COMPLIANCE_SECTION_TEMPLATE = (
+    "🏛️  {code} - {name}\n"
+    "   Key Requirements:\n"
+    "{requirements}"
+    "\n   Azure Controls:\n"
+    "{controls}"
+    "\n"
+)
+_FSI_COMPLIANCE_SECTIONS = {
+    code: _FSI_COMPLIANCE_SECTION_TEMPLATE.format_map({
+        'code': code,
+        'name': details['name'],
+        'requirements': "".join(f"{_BULLET}{req}\n" for req in details['key_requirements']),
+        'controls': "".join(f"{_CHECK}{control}\n" for control in details['azure_controls']),
+    })
+    for code, details in _FSI_COMPLIANCE_DETAILS.items()
+}
+
+_MARKDOWN_PLAN_TEMPLATE = """# Azure FSI Landing Zone Deployment Plan
+
+Generated: {generated}
+
+## Overview
+
+This deployment plan creates a Financial Services Industry (FSI) compliant Azure Landing Zone with:
+- Microsoft FSI Landing Zone reference architecture
+- Azure Verified Modules (AVM)
+- European regulatory compliance (GDPR, DORA, PSD2, MiFID II, EBA GL)
+
+## Configuration
+
+### Environment
+- **Subscription ID**: {subscription_id}
+- **Default Region**: {default_region}
+- **Environment**: {environment}
+- **Naming Prefix**: {naming_prefix}
+
+### Compliance Requirements
+{regulations}
+
+### Policy Initiatives
+{policy_initiatives}
+
+## Architecture
+
+### Network Topology
+- **Type**: {topology}
+
+### Hub Network
+- **Address Space**: {hub_address_space}
+
+### Components
+{hub_components}
+
+## Deployment Steps
+
+1. **Prerequisites Check**
+   - Azure CLI installed
+   - Bicep installed
+   - Authenticated to Azure
+   - Subscription access verified
+
+2. **Policy Assignment**
+   - Apply built-in policy initiatives
+   - Configure custom FSI policies
+   - Set data residency restrictions
+
+3. **Hub Deployment**
+   - Deploy hub virtual network
+   - Deploy Azure Firewall
+   - Deploy VPN Gateway
+   - Deploy Azure Bastion
+
+4. **Spoke Deployment**
+   - Deploy spoke virtual networks
+   - Configure VNet peering
+   - Apply NSGs and route tables
+
+5. **Management Services**
+   - Deploy Log Analytics workspace
+   - Configure Microsoft Defender for Cloud
+   - Deploy Key Vault
+   - Configure backup and recovery
+
+6. **Compliance Validation**
+   - Verify policy compliance
+   - Check security baseline
+   - Validate data residency
+   - Review audit logs
+
+## Security Controls
+
+### Network Security
+- Private endpoints for all PaaS services
+- No public IP addresses allowed
+- Azure Firewall for egress traffic
+- NSGs on all subnets
+
+### Data Protection
+- Encryption at rest with CMK
+- Double encryption enabled
+- Data residency in EU regions only
+- Soft delete and purge protection
+
+### Identity & Access
+- RBAC with least privilege
+- Privileged Identity Management (PIM)
+- Multi-factor authentication required
+- Azure AD integration
+
+## Next Steps
+
+1. Review and approve this plan
+2. Run what-if analysis: `az deployment sub what-if`
+3. Deploy hub infrastructure
+4. Deploy spoke networks
+5. Apply compliance policies
+6. Validate deployment
+7. Configure monitoring and alerts
+
+---
+*Generated by Azure FSI Landing Zone Agent*
+"""
+
+_BASTION_BICEP_TEMPLATE = """// Azure Bastion for FSI Landing Zone
+// Generated by Azure FSI Landing Zone Agent
+
+param location string = '{location}'
+param environment string = '{environment}'
+param namingPrefix string = '{naming_prefix}'
+param hubVNetName string
+
+// Azure Bastion configuration
+var bastionName = '${{namingPrefix}}-bastion-${{environment}}'
+var bastionPublicIPName = '${{bastionName}}-pip'
+
+// Public IP for Bastion (required)
+resource bastionPublicIP 'Microsoft.Network/publicIPAddresses@2023-05-01' = {{
+  name: bastionPublicIPName
+  location: location
+  sku: {{
+    name: 'Standard'
+  }}
+  properties: {{
+    publicIPAllocationMethod: 'Static'
+    publicIPAddressVersion: 'IPv4'
+  }}
+  tags: {{
+    Environment: environment
+    Purpose: 'FSI Bastion'
+    Compliance: 'GDPR,DORA,PSD2'
+  }}
+}}
+
+// Azure Bastion Host
+resource bastion 'Microsoft.Network/bastionHosts@2023-05-01' = {{
+  name: bastionName
+  location: location
+  sku: {{
+    name: 'Standard'  // Standard SKU for FSI requirements
+  }}
+  properties: {{
+    enableTunneling: true  // For native client support
+    enableIpConnect: true  // For IP-based connection
+    enableShareableLink: false  // Disabled for security
+    scaleUnits: 2  // Scale units for performance
+    ipConfigurations: [
+      {{
+        name: 'IpConf'
+        properties: {{
+          subnet: {{
+            id: resourceId('Microsoft.Network/virtualNetworks/subnets', hubVNetName, 'AzureBastionSubnet')
+          }}
+          publicIPAddress: {{
+            id: bastionPublicIP.id
+          }}
+        }}
+      }}
+    ]
+  }}
+  tags: {{
+    Environment: environment
+    Purpose: 'FSI Secure Access'
+    Compliance: 'GDPR,DORA,Zero-Trust'
+  }}
+  dependsOn: [
+    bastionPublicIP
+  ]
+}}
+
+// Diagnostic settings for Bastion
+resource bastionDiagnostics 'Microsoft.Insights/diagnosticSettings@2021-05-01-preview' = {{
+  name: 'bastion-diagnostics'
+  scope: bastion
+  properties: {{
+    logs: [
+      {{
+        category: 'BastionAuditLogs'
+        enabled: true
+        retentionPolicy: {{
+          enabled: true
+          days: 365  // FSI retention requirement
+        }}
+      }}
+    ]
+    metrics: [
+      {{
+        category: 'AllMetrics'
+        enabled: true
+        retentionPolicy: {{
+          enabled: true
+          days: 90
+        }}
+      }}
+    ]
+  }}
+}}
+
+// Outputs
+output bastionId string = bastion.id
+output bastionName string = bastion.name
+output bastionDnsName string = bastionPublicIP.properties.dnsSettings.fqdn
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _render_bastion_bicep(location: str, environment: str, naming_prefix: str) -> bytes:
+    """Render and encode the Bastion template once per distinct configuration."""
+    return _BASTION_BICEP_TEMPLATE.format(
+        location=location,
+        environment=environment,
+        naming_prefix=naming_prefix,
+    ).encode('utf-8')
+
+
+# Entra ID configuration guidance returned by configure_entra_id.
+_ENTRA_ID_CONFIG_TEXT = """\
+🔐 Entra ID (Azure AD) Configuration for FSI Compliance
+
+## Required Configurations
+
+### 1. Multi-Factor Authentication (MFA)
+```bash
+# Enable MFA for all users (Security Defaults)
+az rest --method PATCH \\
+  --uri https://graph.microsoft.com/v1.0/policies/identitySecurityDefaultsEnforcementPolicy \\
+  --body '{{"isEnabled": true}}'
+```
+
+### 2. Privileged Identity Management (PIM)
+Required Roles for PIM:
+   • Global Administrator → PIM activation required
+   • Security Administrator → PIM activation required
+   • Contributor (Subscription) → PIM activation required
+
+Configure in Azure Portal:
+   → Entra ID → Privileged Identity Management
+   → Azure AD Roles → Settings
+   → Require approval for activation
+   → Maximum activation duration: 8 hours
+   → Require MFA on activation
+
+### 3. Sign-in and Audit Logs
+```bash
+# Configure diagnostic settings for Entra ID
+az monitor diagnostic-settings create \\
+  --name 'EntraID-to-LogAnalytics' \\
+  --resource '/providers/microsoft.aadiam/diagnosticSettings' \\
+  --workspace <log-analytics-workspace-id> \\
+  --logs '[{{"category": "SignInLogs", "enabled": true}}, \\
+           {{"category": "AuditLogs", "enabled": true}}, \\
+           {{"category": "RiskyUsers", "enabled": true}}]'
+```
+
+### 4. Password Policy (FSI Requirements)
+Configuration:
+   • Minimum password length: 14 characters
+   • Password complexity: Enabled
+   • Password expiration: 90 days
+   • Password history: Remember 24 passwords
+   • Account lockout: 5 failed attempts
+
+### 5. External Identity Settings
+For B2B collaboration (FSI compliance):
+   • Guest user permissions: Most restrictive
+   • Guest invite settings: Only administrators
+   • External collaboration settings: Specific domains only
+
+## Compliance Mappings
+
+🏛️  RGPD/GDPR:
+   • Sign-in logs for access tracking
+   • Audit logs for data access evidence
+
+🏛️  DORA:
+   • PIM for privileged access management
+   • MFA for strong authentication
+
+🏛️  PSD2:
+   • MFA = Strong Customer Authentication (SCA)
+   • Audit logs for transaction tracking
+
+## Next Steps
+1. Enable Security Defaults or Conditional Access
+2. Configure PIM for privileged roles
+3. Set up diagnostic settings for log export
+4. Review and update password policy
+5. Use deploy_conditional_access tool for policies
+"""
+
+# PIM configuration guidance returned by setup_pim_roles.
+_PIM_CONFIG_TEXT = """\
+👑 Privileged Identity Management (PIM) Configuration
+
+## FSI Required Roles for PIM
+
+### Azure AD Roles (Entra ID)
+```
+Critical Roles (Require PIM + Approval):
+   • Global Administrator
+   • Privileged Role Administrator
+   • Security Administrator
+   • Conditional Access Administrator
+
+Important Roles (Require PIM):
+   • User Administrator
+   • Authentication Administrator
+   • Exchange Administrator
+```
+
+### Azure Resource Roles (Subscription)
+```
+Critical Roles (Require PIM + Approval):
+   • Owner
+   • User Access Administrator
+
+Important Roles (Require PIM):
+   • Contributor
+   • Security Admin
+   • Network Contributor
+```
+
+## PIM Settings for FSI Compliance
+
+### Activation Settings
+```yaml
+activation:
+  require_mfa: true
+  require_justification: true
+  require_ticket_info: true
+  max_duration_hours: 8
+  require_approval: true  # For critical roles
+```
+
+### Assignment Settings
+```yaml
+assignment:
+  allow_permanent_eligible: false
+  allow_permanent_active: false
+  max_eligible_duration_days: 365
+  max_active_duration_days: 0  # No permanent assignments
+```
+
+### Notification Settings
+```yaml
+notifications:
+  send_on_activation: true
+  send_on_approval_request: true
+  send_to:
+    - security-team@company.com
+    - compliance@company.com
+```
+
+## Configuration via PowerShell
+
+```powershell
+# Install PIM module
+Install-Module -Name Microsoft.Graph.Identity.Governance
+
+# Connect
+Connect-MgGraph -Scopes 'RoleManagement.ReadWrite.Directory'
+
+# Get role definition
+$role = Get-MgRoleManagementDirectoryRoleDefinition -Filter "displayName eq 'Global Administrator'"
+
+# Configure role settings
+$params = @{
+  '@odata.type' = '#microsoft.graph.unifiedRoleManagementPolicyRule'
+  id = 'Approval_EndUser_Assignment'
+  setting = @{
+    isApprovalRequired = $true
+    approvalMode = 'SingleStage'
+    approvalStages = @(
+      @{
+        approvalStageTimeOutInDays = 1
+        isApproverJustificationRequired = $true
+      }
+    )
+  }
+}
+
+# Create eligible assignment
+$assignment = @{
+  '@odata.type' = '#microsoft.graph.unifiedRoleEligibilityScheduleRequest'
+  action = 'adminAssign'
+  principalId = '<user-object-id>'
+  roleDefinitionId = $role.Id
+  directoryScopeId = '/'
+  scheduleInfo = @{
+    startDateTime = Get-Date
+    expiration = @{
+      type = 'afterDuration'
+      duration = 'P365D'
+    }
+  }
+}
+
+New-MgRoleManagementDirectoryRoleEligibilityScheduleRequest -BodyParameter $assignment
+```
+
+## Break-Glass Account Setup
+
+⚠️  Critical: Create emergency access accounts
+
+Requirements:
+   • 2 cloud-only accounts (not synced from AD)
+   • Strong, randomly generated passwords (stored securely)
+   • Permanent Global Administrator role
+   • Excluded from Conditional Access policies
+   • Excluded from MFA requirements
+   • Monitored for any sign-in activity
+
+```bash
+# Create break-glass account
+az ad user create \\
+  --display-name 'Break Glass Account 1' \\
+  --user-principal-name breakglass1@yourdomain.onmicrosoft.com \\
+  --password '<strong-random-password>'
+```
+
+## Compliance Mapping
+
+🏛️  DORA:
+   • PIM = Privileged access management
+   • Approval workflows = Change control
+
+🏛️  ISO 27001:
+   • PIM = Access control (A.9.2.3)
+   • Time-limited access = Least privilege
+
+🏛️  NIS2:
+   • PIM = Risk management for admin access
+   • MFA on activation = Strong authentication
+
+## Audit and Monitoring
+
+```bash
+# Export PIM audit logs
+az monitor activity-log list \\
+  --resource-group <rg-name> \\
+  --caller 'PIMService' \\
+  --output table
+```
+
+💡 Next Steps:
+1. Identify privileged roles in your organization
+2. Enable PIM for Azure AD roles
+3. Enable PIM for Azure resource roles
+4. Configure activation settings (MFA, approval)
+5. Assign eligible users (no permanent assignments)
+6. Create break-glass accounts
+7. Set up monitoring and alerts for PIM activations
+"""
+
+# Conditional Access policies (title, Graph API payload), serialized once.
+_CONDITIONAL_ACCESS_POLICIES = [
+    (
+        "Require MFA for All Users",
+        {
+            "displayName": "FSI: Require MFA for All Users",
+            "state": "enabled",
+            "conditions": {
+                "users": {
+                    "includeUsers": ["All"]
+                },
+                "applications": {
+                    "includeApplications": ["All"]
+                }
+            },
+            "grantControls": {
+                "operator": "OR",
+                "builtInControls": ["mfa"]
+            }
+        },
+    ),
+    (
+        "Block Access from Non-EU Locations",
+        {
+            "displayName": "FSI: Block Non-EU Access",
+            "state": "enabledForReportingButNotEnforced",
+            "conditions": {
+                "users": {
+                    "includeUsers": ["All"]
+                },
+                "applications": {
+                    "includeApplications": ["All"]
+                },
+                "locations": {
+                    "includeLocations": ["All"],
+                    "excludeLocations": ["EU", "EuropeanUnion"]
+                }
+            },
+            "grantControls": {
+                "operator": "OR",
+                "builtInControls": ["block"]
+            }
+        },
+    ),
+    (
+        "Require Compliant Device for Admins",
+        {
+            "displayName": "FSI: Admins Require Compliant Device",
+            "state": "enabled",
+            "conditions": {
+                "users": {
+                    "includeRoles": [
+                        "Global Administrator",
+                        "Security Administrator",
+                        "Privileged Role Administrator"
+                    ]
+                },
+                "applications": {
+                    "includeApplications": ["All"]
+                }
+            },
+            "grantControls": {
+                "operator": "AND",
+                "builtInControls": ["mfa", "compliantDevice"]
+            }
+        },
+    ),
+    (
+        "Block Legacy Authentication",
+        {
+            "displayName": "FSI: Block Legacy Authentication",
+            "state": "enabled",
+            "conditions": {
+                "users": {
+                    "includeUsers": ["All"]
+                },
+                "applications": {
+                    "includeApplications": ["All"]
+                },
+                "clientAppTypes": ["exchangeActiveSync", "other"]
+            },
+            "grantControls": {
+                "operator": "OR",
+                "builtInControls": ["block"]
+            }
+        },
+    ),
+    (
+        "Require App Protection for Mobile",
+        {
+            "displayName": "FSI: Mobile App Protection Required",
+            "state": "enabled",
+            "conditions": {
+                "users": {
+                    "includeUsers": ["All"]
+                },
+                "applications": {
+                    "includeApplications": ["Office365"]
+                },
+                "platforms": {
+                    "includePlatforms": ["iOS", "android"]
+                }
+            },
+            "grantControls": {
+                "operator": "OR",
+                "builtInControls": ["approvedApplication", "compliantApplication"]
+            }
+        },
+    ),
+]
+
+_CONDITIONAL_ACCESS_POLICY_JSON = [
+    json.dumps(policy, indent=2) for _, policy in _CONDITIONAL_ACCESS_POLICIES
+]
+
+# Regulation mapping table appended after the policy definitions.
+_CONDITIONAL_ACCESS_COMPLIANCE_TABLE = (
+    "## Compliance Mapping\n\n"
+    "| Policy | Regulation | Control |\n"
+    "|--------|------------|----------|\n"
+    "| MFA Required | PSD2, DORA | Strong Authentication |\n"
+    "| Block Non-EU | GDPR | Data Sovereignty |\n"
+    "| Compliant Device | ISO 27001 | Device Management |\n"
+    "| Block Legacy Auth | CRD IV | Modern Security |\n"
+    "| App Protection | DORA | Mobile Security |\n\n"
+)
+
+# Payload written to conditional-access-policies.json; same policies as displayed.
+_CONDITIONAL_ACCESS_FILE_BYTES = json.dumps(
+    {"policies": [policy for _, policy in _CONDITIONAL_ACCESS_POLICIES]}, indent=2
+).encode('utf-8')
+
+# Full deploy_conditional_access report; only the saved file path varies per call.
+_CONDITIONAL_ACCESS_TEXT = (
+    "🛡️  Conditional Access Policies for FSI Compliance\n\n"
+    + "".join(
+        f"## Policy {number}: {title}\n\n```json\n{policy_json}\n```\n\n"
+        for number, ((title, _), policy_json) in enumerate(
+            zip(_CONDITIONAL_ACCESS_POLICIES, _CONDITIONAL_ACCESS_POLICY_JSON), 1
+        )
+    )
+    + "## Deployment via Microsoft Graph API\n\n"
+    "```bash\n"
+    "# Prerequisites\n"
+    "# 1. Install Microsoft Graph PowerShell: Install-Module Microsoft.Graph\n"
+    "# 2. Connect: Connect-MgGraph -Scopes 'Policy.ReadWrite.ConditionalAccess'\n\n"
+    "# Create policy\n"
+    "az rest --method POST \\\n"
+    "  --uri https://graph.microsoft.com/v1.0/identity/conditionalAccess/policies \\\n"
+    "  --body @policy.json\n"
+    "```\n\n"
+    + _CONDITIONAL_ACCESS_COMPLIANCE_TABLE
+    + "💡 Recommendations:\n"
+    "1. Start with 'Report-only' mode\n"
+    "2. Review sign-in logs for impact\n"
+    "3. Enable policies gradually\n"
+    "4. Create break-glass admin account (exclude from CA)\n"
+    "5. Document all policies for compliance audits\n"
+)
+
+# Appended to the system prompt when squad mode is enabled.
+_SQUAD_PROMPT_TEXT = """
+
+🤖 SQUAD MODE ENABLED - Multi-Agent Orchestration
+
+You have access to specialist agents for deep domain analysis:
+- 🔒 Security Agent: Compliance (GDPR/DORA/PSD2), Key Vault, NSGs, Entra ID
+- 🌐 Network Agent: Hub-spoke topology, Firewall, Private Endpoints, VNet peering
+- 🚀 DevOps Agent: CI/CD pipelines, deployment automation, GitOps
+- 🏗️  Architect Agent: Cross-domain synthesis, best practices, cost optimization
+
+DELEGATION GUIDELINES:
+
+1. **Use delegation tools** for specialist tasks:
+   - Security reviews → delegate_to_security
+   - Network analysis → delegate_to_network
+   - Pipeline/deployment → delegate_to_devops
+   - Comprehensive review → run_squad_review (all specialists + synthesis)
+
+2. **When to delegate**:
+   - User asks for security/compliance review → Security Agent
+   - User asks about network topology/connectivity → Network Agent
+   - User asks about CI/CD or deployment automation → DevOps Agent
+   - User asks "review my deployment" → run_squad_review (parallel analysis)
+
+3. **Workflow patterns**:
+   - **Parallel** (preferred): For independent analyses, use run_squad_review
+   - **Sequential**: For dependent tasks, chain delegate_to_* calls
+   - **Synthesis**: Architect agent automatically synthesizes multi-agent results
+
+4. **Context sharing**: Pass project_name, tier, environment_type to specialists via context parameter
+
+Example:
+User: "Review my Ring 0 security for production"
+→ Use delegate_to_security with context: {ring: "0", environment: "prod"}
+
+User: "Review entire deployment for compliance"
+→ Use run_squad_review (all agents in parallel + synthesis)
+"""
+
+
+# ============================================================================
+# TOOL HELPERS
+# ============================================================================
+
+# Seconds a successful `az account show/list` result is reused
+_AZ_ACCOUNT_CACHE_TTL = 300
+
+# Azure CLI/Bicep checks before any probe has succeeded
+_NO_CLI_TOOLS = MappingProxyType({
+    'azure_cli': False,
+    'azure_cli_version': None,
+    'bicep': False,
+    'bicep_version': None
+})
+
+def _frozen_text_response(text: str) -> MappingProxyType:
+    """Build a read-only tool response holding a single text block."""
+    return MappingProxyType({
+        "content": (MappingProxyType({"type": "text", "text": text}),)
+    })
+
+
+def _freeze_response(response: dict) -> MappingProxyType:
+    """Make a tool response and its content blocks read-only."""
+    return MappingProxyType({
+        **response,
+        "content": tuple(MappingProxyType(block) for block in response["content"])
+    })
+
+
+# Responses of the input-independent guidance tools. The SDK only reads tool
+# results, so one frozen response is shared by every call.
+_ENTRA_ID_CONFIG_RESPONSE = _frozen_text_response(_ENTRA_ID_CONFIG_TEXT)
+
+_PIM_CONFIG_RESPONSE = _frozen_text_response(_PIM_CONFIG_TEXT)
+
+_CONDITIONAL_ACCESS_UNSAVED_RESPONSE = _frozen_text_response(
+    _CONDITIONAL_ACCESS_TEXT + "\n\n❌ File not saved. Please set a project name first using set_project_name tool."
+)
+
+_NO_PROJECT_RESPONSE = _frozen_text_response(
+    "❌ Please set a project name first using set_project_name tool."
+)
+
+
+def requires_project_dir(handler):
+    """
+    Resolve the project directory before running a file-writing tool.
+
+    Place below @tool. The wrapped handler receives ``project_dir`` as a
+    keyword argument; if no project name is set, the standard error response
+    is returned without calling it.
+    """
+    @functools.wraps(handler)
+    async def wrapper(self, args):
+        try:
+            project_dir = self.get_project_dir()
+        except ValueError:
+            return _NO_PROJECT_RESPONSE
+        return await handler(self, args, project_dir=project_dir)
+
+    return wrapper
+
+
+def cached_response(handler):
+    """
+    Memoize the response of a tool that depends only on the agent's config.
+
+    Place below @tool. The first call's result is frozen, kept per agent
+    instance and shared by later calls, so a mutating caller cannot corrupt it.
+    """
+    @functools.wraps(handler)
+    async def wrapper(self, args):
+        response = self._cached_responses.get(handler.__name__)
+        if response is None:
+            response = self._cached_responses[handler.__name__] = _freeze_response(await handler(self, args))
+        return response
+
+    return wrapper
+
+
 class AzureFSILandingZoneAgent(InteractiveAgent):
     """
     Azure FSI Landing Zone deployment agent.
@@ -41,12 +939,63 @@ class AzureFSILandingZoneAgent(InteractiveAgent):
     - Security and compliance validation
     """
 
+    # export_deployment_plan format -> generator method name
+    _PLAN_FORMATTERS = {
+        "markdown": "_generate_markdown_plan",
+        "json": "_generate_json_plan",
+    }
+
+    # generate_bicep_template component -> generator method name
+    _BICEP_GENERATORS = {
+        "hub-vnet": "_generate_hub_vnet_bicep",
+        "spoke-vnet": "_generate_spoke_vnet_bicep",
+        "key-vault": "_generate_keyvault_bicep",
+        "storage": "_generate_storage_bicep",
+        "policy-assignment": "_generate_policy_bicep",
+    }
+
     def __init__(self, config_dir: Path, squad_mode: bool = False):
         super().__init__(config_dir)
         self.azure_config = self.agent_config.get('azure', {})
         self.compliance_config = self.azure_config.get('compliance', {})
         self.deployment_config = self.agent_config.get('deployment', {})
 
+        # Config sections read by the derived values below and by the tool handlers
+        self._landing_zone = self.azure_config.get('landing_zone', {})
+        self._arch_config = self.azure_config.get('architecture', {})
+        self._hub_config = self._arch_config.get('hub', {})
+        self._spoke_config = self._arch_config.get('spoke_template', {})
+        self._custom_policies = self.compliance_config.get('custom_policies', {})
+
+        # Markdown bullet lists for the deployment plan, rendered once from config
+        self._regulations_md = "\n".join(
+            f"- {reg}" for reg in self.compliance_config.get('regulations', [])
+        )
+        self._policy_initiatives_md = "\n".join(
+            f"- {init}" for init in self.compliance_config.get('policy_initiatives', [])
+        )
+        self._hub_components_md = "\n".join(
+            f"- {comp}" for comp in self._hub_config.get('components', [])
+        )
+
+        # Landing zone parameters written into generated templates, with template defaults
+        self._default_region = self._landing_zone.get('default_region', 'westeurope')
+        self._environment = self._landing_zone.get('environment', 'prod')
+        self._naming_prefix = self._landing_zone.get('naming_prefix', 'fsi')
+
+        # Config-derived fields of the markdown plan; only 'generated' changes per export
+        self._markdown_plan_params = {
+            'subscription_id': self.azure_config.get('subscription_id', 'TBD'),
+            'default_region': self._landing_zone.get('default_region'),
+            'environment': self._landing_zone.get('environment'),
+            'naming_prefix': self._landing_zone.get('naming_prefix'),
+            'regulations': self._regulations_md,
+            'policy_initiatives': self._policy_initiatives_md,
+            'topology': self._arch_config.get('topology', 'hub-spoke'),
+            'hub_address_space': self._hub_config.get('vnet_address_space'),
+            'hub_components': self._hub_components_md,
+        }
+
         # Squad mode configuration
         self.squad_mode = squad_mode
         self.squad_agents: Dict[str, Any] = {}  # Initialized on-demand
@@ -55,7 +1004,7 @@ class AzureFSILandingZoneAgent(InteractiveAgent):
         self.deployment_state = {
             'current_deployment': None,
             'deployments_count': 0,
-            'last_validation': None,
+            'last_validation': None,  # datetime, formatted when status is read
             'policies_applied': []
         }
 
@@ -63,10 +1012,13 @@ class AzureFSILandingZoneAgent(InteractiveAgent):
         self.project_name: Optional[str] = None
 
         # Ring-based deployment tracking
-        self.deployment_rings = self.azure_config.get('architecture', {}).get('deployment_rings', {})
+        self.deployment_rings = self._arch_config.get('deployment_rings', {})
         self.selected_rings: List[str] = []  # Rings to deploy
         self.ring_depth: str = "standard"  # minimal, standard, advanced
 
+        # Rendered list_deployment_rings catalog (lazy-loaded, rings are static config)
+        self._rings_catalog_text: Optional[str] = None
+
         # Free Tier and Environment tracking
         self.is_free_tier: Optional[bool] = None  # Detected or set by user
         self.environment_type: Optional[str] = None  # dev, test, staging, prod, sandbox
@@ -75,6 +1027,38 @@ class AzureFSILandingZoneAgent(InteractiveAgent):
         # Cached AVM manifest (lazy-loaded)
         self._avm_manifest: Optional[Dict[str, Dict[str, Any]]] = None
 
+        # Rendered system prompt (lazy-loaded)
+        self._system_prompt: Optional[str] = None
+
+        # Rendered Bicep templates by component as (500-char preview, UTF-8 bytes)
+        # (lazy-loaded, config and AVM manifest are static)
+        self._bicep_templates: Dict[str, tuple] = {}
+
+        # Serialized JSON plan minus its timestamp (lazy-loaded)
+        self._json_plan_body: Optional[str] = None
+
+        # Output directories already created on disk (skips mkdir on later calls);
+        # writes re-create their parent directory in the worker thread regardless
+        self._ensured_dirs: set = set()
+
+        # Generated files written this session: path -> (bytes, (mtime_ns, size) after the write)
+        self._written_outputs: Dict[Path, tuple] = {}
+
+        # Responses of config-only tools, keyed by handler name (see cached_response)
+        self._cached_responses: Dict[str, Dict[str, Any]] = {}
+
+        # Parsed `az account` output: command -> (expires_at, profile mtime, data)
+        self._az_account_cache: Dict[tuple, tuple] = {}
+
+        # `az account` queries currently running, so concurrent callers share one process
+        self._az_account_inflight: Dict[tuple, "asyncio.Future"] = {}
+
+        # `az bicep build` runs in progress per project directory (see _bicep_build_errors)
+        self._bicep_builds_inflight: Dict[Path, "asyncio.Future"] = {}
+
+        # Last complete Azure CLI/Bicep probe as (PATH, checks); installs don't change mid-session
+        self._cli_tools_cache: Optional[tuple] = None
+
     def get_project_dir(self) -> Path:
         """
         Get the project directory for storing generated assets.
@@ -85,16 +1069,46 @@ class AzureFSILandingZoneAgent(InteractiveAgent):
             raise ValueError("Project name not set. Please provide a project name first.")
 
         project_dir = self.config_dir / self.project_name
-        project_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(project_dir)
         return project_dir
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create an output directory once per agent session."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    async def _write_output(self, path: Path, data: bytes) -> None:
+        """
+        Write a generated file off the event loop.
+
+        The write is skipped when this session already wrote the same bytes to
+        path and the file still has the size and mtime it had afterwards.
+        """
+        previous = self._written_outputs.get(path)
+        if previous is not None and previous[0] == data:
+            try:
+                stat = await asyncio.to_thread(path.stat)
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == previous[1]:
+                return
+
+        def write() -> tuple:
+            path.parent.mkdir(parents=True, exist_ok=True)  # The folder may be removed mid-session
+            path.write_bytes(data)
+            stat = path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+
+        self._written_outputs[path] = (data, await asyncio.to_thread(write))
+
     # -------------------------------------------------------------------------
     # Azure Verified Module (AVM) manifest helpers
     # -------------------------------------------------------------------------
 
     def _avm_manifest_path(self) -> Path:
         """Resolve the AVM manifest path from configuration."""
-        manifest_name = self.azure_config.get('landing_zone', {}).get('avm_manifest', 'avm-modules.yaml')
+        manifest_name = self._landing_zone.get('avm_manifest', 'avm-modules.yaml')
         candidate = self.config_dir / manifest_name
         if candidate.exists():
             return candidate
@@ -166,7 +1180,6 @@ class AzureFSILandingZoneAgent(InteractiveAgent):
             return  # Already initialized or not in squad mode
 
         # Lazy import to avoid overhead in solo mode
-        import sys
         sub_agents_path = self.config_dir / "sub-agents"
         if str(sub_agents_path) not in sys.path:
             sys.path.insert(0, str(sub_agents_path))
@@ -262,6 +1275,12 @@ Please provide:
 
     def get_system_prompt(self) -> Optional[str]:
         """Get the system prompt for this agent."""
+        if self._system_prompt is None:
+            self._system_prompt = self._build_system_prompt()
+        return self._system_prompt
+
+    def _build_system_prompt(self) -> str:
+        """Render the system prompt from the AVM manifest and squad mode."""
         virtual_network_ref = self._avm_module_reference(
             'virtual_network',
             fallback="br/public:avm/res/network/virtual-network:0.1.8",
@@ -314,62 +1333,24 @@ Your expertise includes:
 - Network security with private endpoints and NSGs
 - Identity and access management with Azure AD
 - Compliance monitoring and auditing
-- Bicep and Terraform Infrastructure as Code
-- Azure Policy and governance frameworks
-- Security baseline configuration
-
-You prioritize:
-- Security by design
-- Compliance with European regulations
-- Zero-trust architecture principles
-- Least privilege access
-- Data protection and privacy
-- Operational resilience (DORA requirements)
-
-You provide step-by-step guidance, validate configurations before deployment,
-and ensure best practices are followed for financial services workloads in Azure.
-"""
-
-        if self.squad_mode:
-            squad_prompt = """
-
-🤖 SQUAD MODE ENABLED - Multi-Agent Orchestration
-
-You have access to specialist agents for deep domain analysis:
-- 🔒 Security Agent: Compliance (GDPR/DORA/PSD2), Key Vault, NSGs, Entra ID
-- 🌐 Network Agent: Hub-spoke topology, Firewall, Private Endpoints, VNet peering
-- 🚀 DevOps Agent: CI/CD pipelines, deployment automation, GitOps
-- 🏗️  Architect Agent: Cross-domain synthesis, best practices, cost optimization
-
-DELEGATION GUIDELINES:
-
-1. **Use delegation tools** for specialist tasks:
-   - Security reviews → delegate_to_security
-   - Network analysis → delegate_to_network
-   - Pipeline/deployment → delegate_to_devops
-   - Comprehensive review → run_squad_review (all specialists + synthesis)
-
-2. **When to delegate**:
-   - User asks for security/compliance review → Security Agent
-   - User asks about network topology/connectivity → Network Agent
-   - User asks about CI/CD or deployment automation → DevOps Agent
-   - User asks "review my deployment" → run_squad_review (parallel analysis)
-
-3. **Workflow patterns**:
-   - **Parallel** (preferred): For independent analyses, use run_squad_review
-   - **Sequential**: For dependent tasks, chain delegate_to_* calls
-   - **Synthesis**: Architect agent automatically synthesizes multi-agent results
-
-4. **Context sharing**: Pass project_name, tier, environment_type to specialists via context parameter
+- Bicep and Terraform Infrastructure as Code
+- Azure Policy and governance frameworks
+- Security baseline configuration
 
-Example:
-User: "Review my Ring 0 security for production"
-→ Use delegate_to_security with context: {ring: "0", environment: "prod"}
+You prioritize:
+- Security by design
+- Compliance with European regulations
+- Zero-trust architecture principles
+- Least privilege access
+- Data protection and privacy
+- Operational resilience (DORA requirements)
 
-User: "Review entire deployment for compliance"
-→ Use run_squad_review (all agents in parallel + synthesis)
+You provide step-by-step guidance, validate configurations before deployment,
+and ensure best practices are followed for financial services workloads in Azure.
 """
-            return base_prompt + squad_prompt
+
+        if self.squad_mode:
+            return base_prompt + _SQUAD_PROMPT_TEXT
 
         return base_prompt
 
@@ -426,7 +1407,6 @@ User: "Review entire deployment for compliance"
             }
 
         # Sanitize project name (remove invalid characters for filesystem)
-        import re
         sanitized_name = re.sub(r'[^\w\-_]', '_', project_name)
 
         self.project_name = sanitized_name
@@ -446,8 +1426,6 @@ User: "Review entire deployment for compliance"
     @tool("detect_subscription_tier", "Detect if Azure subscription is Free Tier or Standard", {})
     async def detect_subscription_tier(self, args):
         """Detect subscription tier by running the detection script."""
-        import subprocess
-
         script_path = self.config_dir / "scripts" / "detect-free-tier.sh"
 
         if not script_path.exists():
@@ -459,12 +1437,8 @@ User: "Review entire deployment for compliance"
 
         try:
             # Run the detection script
-            result = subprocess.run(
-                [str(script_path)],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=self.config_dir
+            result = await self._run_command(
+                [str(script_path)], timeout=60, cwd=self.config_dir, capture_stderr=False
             )
 
             # Read the flag file
@@ -598,9 +1572,23 @@ User: "Review entire deployment for compliance"
                 ]
             }
 
-        rings_text = "🎯 Available Deployment Rings for FSI Landing Zone:\n\n"
-        rings_text += "Deploy your landing zone progressively using a ring-based approach.\n"
-        rings_text += "Each ring contains specific components and can be deployed independently.\n\n"
+        if self._rings_catalog_text is None:
+            self._rings_catalog_text = self._render_rings_catalog()
+
+        return {
+            "content": [
+                {"type": "text", "text": self._rings_catalog_text}
+            ]
+        }
+
+    def _render_rings_catalog(self) -> str:
+        """Render the list_deployment_rings text from the static ring configuration."""
+        separator = '=' * 80
+        parts = [
+            "🎯 Available Deployment Rings for FSI Landing Zone:\n\n"
+            "Deploy your landing zone progressively using a ring-based approach.\n"
+            "Each ring contains specific components and can be deployed independently.\n\n"
+        ]
 
         # Sort rings by deployment order
         sorted_rings = sorted(
@@ -609,56 +1597,55 @@ User: "Review entire deployment for compliance"
         )
 
         for ring_name, ring_data in sorted_rings:
-            rings_text += f"{'=' * 80}\n"
-            rings_text += f"📦 {ring_name.upper().replace('_', ' ')}\n"
-            rings_text += f"{'=' * 80}\n"
-            rings_text += f"Description: {ring_data.get('description', 'N/A')}\n"
-            rings_text += f"Order: {ring_data.get('deployment_order', 'N/A')}\n"
-            rings_text += f"Mandatory: {'✅ Yes' if ring_data.get('mandatory') else '⚠️  Optional'}\n"
-            rings_text += f"Default Depth: {ring_data.get('depth', 'standard')}\n"
+            parts.append(
+                f"{separator}\n"
+                f"📦 {ring_name.upper().replace('_', ' ')}\n"
+                f"{separator}\n"
+                f"Description: {ring_data.get('description', 'N/A')}\n"
+                f"Order: {ring_data.get('deployment_order', 'N/A')}\n"
+                f"Mandatory: {'✅ Yes' if ring_data.get('mandatory') else '⚠️  Optional'}\n"
+                f"Default Depth: {ring_data.get('depth', 'standard')}\n"
+            )
 
             if ring_data.get('depends_on'):
-                rings_text += f"Dependencies: {', '.join(ring_data['depends_on'])}\n"
+                parts.append(f"Dependencies: {', '.join(ring_data['depends_on'])}\n")
 
-            rings_text += f"\nComponents:\n"
+            parts.append("\nComponents:\n")
 
-            components = ring_data.get('components', {})
+            components = ring_data.get('components', _EMPTY)
             for category, items in components.items():
-                rings_text += f"\n  🔷 {category.replace('_', ' ').title()}:\n"
+                parts.append(f"\n  🔷 {category.replace('_', ' ').title()}:\n")
                 for item in items:
                     component_name = item.get('component', 'unknown')
                     is_mandatory = item.get('mandatory', False)
                     status = "✓" if is_mandatory else "○"
-                    rings_text += f"    {status} {component_name}\n"
+                    parts.append(f"    {status} {component_name}\n")
 
                     # Show policies if available
                     if 'policies' in item:
-                        for policy in item['policies']:
-                            rings_text += f"        ├─ Policy: {policy}\n"
+                        parts.extend(f"        ├─ Policy: {policy}\n" for policy in item['policies'])
 
-            rings_text += "\n"
+            parts.append("\n")
 
         # Show depth profiles
-        depth_profiles = self.deployment_rings.get('depth_profiles', {})
+        depth_profiles = self.deployment_rings.get('depth_profiles', _EMPTY)
         if depth_profiles:
-            rings_text += f"{'=' * 80}\n"
-            rings_text += "📊 DEPLOYMENT DEPTH PROFILES\n"
-            rings_text += f"{'=' * 80}\n\n"
+            parts.append(f"{separator}\n📊 DEPLOYMENT DEPTH PROFILES\n{separator}\n\n")
             for depth_name, depth_data in depth_profiles.items():
-                rings_text += f"🎚️  {depth_name.upper()}\n"
-                rings_text += f"   {depth_data.get('description', 'N/A')}\n"
-                rings_text += f"   Filter: {depth_data.get('components_filter', 'N/A')}\n\n"
-
-        rings_text += "\n💡 Usage:\n"
-        rings_text += "   1. Use select_deployment_rings to choose which rings to deploy\n"
-        rings_text += "   2. Use set_ring_depth to choose deployment depth (minimal/standard/advanced)\n"
-        rings_text += "   3. Use generate_ring_deployment to generate all templates for selected rings\n"
+                parts.append(
+                    f"🎚️  {depth_name.upper()}\n"
+                    f"   {depth_data.get('description', 'N/A')}\n"
+                    f"   Filter: {depth_data.get('components_filter', 'N/A')}\n\n"
+                )
+
+        parts.append(
+            "\n💡 Usage:\n"
+            "   1. Use select_deployment_rings to choose which rings to deploy\n"
+            "   2. Use set_ring_depth to choose deployment depth (minimal/standard/advanced)\n"
+            "   3. Use generate_ring_deployment to generate all templates for selected rings\n"
+        )
 
-        return {
-            "content": [
-                {"type": "text", "text": rings_text}
-            ]
-        }
+        return "".join(parts)
 
     @tool("select_deployment_rings", "Select which deployment rings to deploy", {"rings": str})
     async def select_deployment_rings(self, args):
@@ -698,7 +1685,7 @@ User: "Review entire deployment for compliance"
         # Check dependencies
         result_text = f"✅ Selected deployment rings:\n\n"
         for ring_name in self.selected_rings:
-            ring_data = self.deployment_rings.get(ring_name, {})
+            ring_data = self.deployment_rings.get(ring_name, _EMPTY)
             result_text += f"   ✓ {ring_name}\n"
             result_text += f"     └─ {ring_data.get('description', 'N/A')}\n"
 
@@ -734,8 +1721,8 @@ User: "Review entire deployment for compliance"
 
         self.ring_depth = depth
 
-        depth_profiles = self.deployment_rings.get('depth_profiles', {})
-        depth_info = depth_profiles.get(depth, {})
+        depth_profiles = self.deployment_rings.get('depth_profiles', _EMPTY)
+        depth_info = depth_profiles.get(depth, _EMPTY)
 
         result_text = f"✅ Deployment depth set to: {depth.upper()}\n\n"
         result_text += f"📋 Description: {depth_info.get('description', 'N/A')}\n"
@@ -777,14 +1764,13 @@ User: "Review entire deployment for compliance"
         components_by_ring = {}
 
         # Process each selected ring
-        for ring_name in sorted(self.selected_rings, key=lambda r: self.deployment_rings.get(r, {}).get('deployment_order', 999)):
-            ring_data = self.deployment_rings.get(ring_name, {})
+        for ring_name in sorted(self.selected_rings, key=lambda r: self.deployment_rings.get(r, _EMPTY).get('deployment_order', 999)):
+            ring_data = self.deployment_rings.get(ring_name, _EMPTY)
             ring_dir = project_dir / ring_name
-            ring_dir.mkdir(parents=True, exist_ok=True)
 
             result_text += f"\n📦 {ring_name.upper().replace('_', ' ')}:\n"
 
-            components = ring_data.get('components', {})
+            components = ring_data.get('components', _EMPTY)
             ring_components = []
 
             for category, items in components.items():
@@ -814,28 +1800,31 @@ User: "Review entire deployment for compliance"
             summary_path = ring_dir / "DEPLOYMENT.md"
             summary_content = self._generate_ring_summary(ring_name, ring_data, ring_components)
 
-            with open(summary_path, 'w') as f:
-                f.write(summary_content)
+            # Component placeholders, written only where no template exists yet
+            placeholders = {
+                ring_dir / f"{comp['name']}.bicep": f"// {comp['name']} - {category}\n// TODO: Implement component\n"
+                for comp in ring_components
+            }
+
+            created = await asyncio.to_thread(
+                self._write_ring_files, summary_path, summary_content, placeholders
+            )
 
             generated_files.append(str(summary_path))
             result_text += f"   ✓ Generated: {summary_path.name}\n"
-
-            # Generate component placeholders
-            for comp in ring_components:
-                comp_file = ring_dir / f"{comp['name']}.bicep"
-                if not comp_file.exists():
-                    placeholder = f"// {comp['name']} - {category}\n// TODO: Implement component\n"
-                    with open(comp_file, 'w') as f:
-                        f.write(placeholder)
-                    result_text += f"   ○ Created placeholder: {comp['name']}.bicep\n"
+            for comp_file in created:
+                result_text += f"   ○ Created placeholder: {comp_file.name}\n"
 
         # Generate main deployment script
         main_deploy_path = project_dir / "deploy.sh"
         deploy_script = self._generate_deployment_script(components_by_ring)
 
-        with open(main_deploy_path, 'w') as f:
-            f.write(deploy_script)
-        main_deploy_path.chmod(0o755)  # Make executable
+        def write_deploy_script() -> None:
+            main_deploy_path.parent.mkdir(parents=True, exist_ok=True)
+            main_deploy_path.write_text(deploy_script)
+            main_deploy_path.chmod(0o755)  # Make executable
+
+        await asyncio.to_thread(write_deploy_script)
 
         generated_files.append(str(main_deploy_path))
 
@@ -852,57 +1841,76 @@ User: "Review entire deployment for compliance"
             ]
         }
 
+    @staticmethod
+    def _write_text_file(path: Path, content: str) -> None:
+        """Write a text file, re-creating its directory if it was removed mid-session."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    @staticmethod
+    def _write_ring_files(summary_path: Path, summary_content: str, placeholders: Dict[Path, str]) -> List[Path]:
+        """Write a ring's summary and any missing placeholders; return the placeholders created."""
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        summary_path.write_text(summary_content)
+
+        created = []
+        for comp_file, placeholder in placeholders.items():
+            if not comp_file.exists():
+                comp_file.write_text(placeholder)
+                created.append(comp_file)
+        return created
+
     def _generate_ring_summary(self, ring_name: str, ring_data: dict, components: list) -> str:
         """Generate deployment summary for a ring."""
-        summary = f"# {ring_name.upper().replace('_', ' ')} - Deployment Guide\n\n"
-        summary += f"**Description**: {ring_data.get('description', 'N/A')}\n\n"
-        summary += f"**Deployment Order**: {ring_data.get('deployment_order', 'N/A')}\n\n"
-        summary += f"**Mandatory**: {'Yes' if ring_data.get('mandatory') else 'No'}\n\n"
+        parts = [
+            f"# {ring_name.upper().replace('_', ' ')} - Deployment Guide\n\n",
+            f"**Description**: {ring_data.get('description', 'N/A')}\n\n",
+            f"**Deployment Order**: {ring_data.get('deployment_order', 'N/A')}\n\n",
+            f"**Mandatory**: {'Yes' if ring_data.get('mandatory') else 'No'}\n\n",
+        ]
 
         if ring_data.get('depends_on'):
-            summary += f"**Dependencies**: {', '.join(ring_data['depends_on'])}\n\n"
+            parts.append(f"**Dependencies**: {', '.join(ring_data['depends_on'])}\n\n")
 
-        summary += "## Components\n\n"
-        summary += f"Total components in this ring: {len(components)}\n\n"
+        parts.append("## Components\n\n")
+        parts.append(f"Total components in this ring: {len(components)}\n\n")
 
         # Group by category
         by_category = {}
         for comp in components:
-            category = comp['category']
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(comp)
+            by_category.setdefault(comp['category'], []).append(comp)
 
         for category, items in by_category.items():
-            summary += f"### {category.replace('_', ' ').title()}\n\n"
+            parts.append(f"### {category.replace('_', ' ').title()}\n\n")
             for item in items:
                 status = "**[MANDATORY]**" if item['mandatory'] else "[Optional]"
-                summary += f"- {status} `{item['name']}`\n"
-            summary += "\n"
-
-        summary += "## Deployment\n\n"
-        summary += "```bash\n"
-        summary += f"# Deploy {ring_name}\n"
-        summary += "az deployment sub create \\\n"
-        summary += f"  --location francecentral \\\n"
-        summary += f"  --template-file main.bicep \\\n"
-        summary += f"  --parameters @main.parameters.json\n"
-        summary += "```\n\n"
-
-        summary += "## Validation\n\n"
-        summary += "```bash\n"
-        summary += f"# Validate {ring_name} before deployment\n"
-        summary += "az deployment sub validate \\\n"
-        summary += f"  --location francecentral \\\n"
-        summary += f"  --template-file main.bicep \\\n"
-        summary += f"  --parameters @main.parameters.json\n"
-        summary += "```\n"
+                parts.append(f"- {status} `{item['name']}`\n")
+            parts.append("\n")
+
+        parts.append(
+            "## Deployment\n\n"
+            "```bash\n"
+            f"# Deploy {ring_name}\n"
+            "az deployment sub create \\\n"
+            "  --location francecentral \\\n"
+            "  --template-file main.bicep \\\n"
+            "  --parameters @main.parameters.json\n"
+            "```\n\n"
+            "## Validation\n\n"
+            "```bash\n"
+            f"# Validate {ring_name} before deployment\n"
+            "az deployment sub validate \\\n"
+            "  --location francecentral \\\n"
+            "  --template-file main.bicep \\\n"
+            "  --parameters @main.parameters.json\n"
+            "```\n"
+        )
 
-        return summary
+        return "".join(parts)
 
     def _generate_deployment_script(self, components_by_ring: dict) -> str:
         """Generate main deployment script for all rings."""
-        script = """#!/bin/bash
+        parts = ["""#!/bin/bash
 # FSI Landing Zone - Ring-based Deployment Script
 # Generated by Azure FSI Landing Zone Agent
 
@@ -948,13 +1956,13 @@ log_info "Using subscription: $SUBSCRIPTION_ID"
 LOCATION="${AZURE_LOCATION:-francecentral}"
 log_info "Deployment region: $LOCATION"
 
-"""
+"""]
 
         # Add deployment functions for each ring
         sorted_rings = sorted(components_by_ring.items(), key=lambda x: len(x[0]))
 
         for ring_name, components in sorted_rings:
-            script += f"""
+            parts.append(f"""
 # Deploy {ring_name}
 deploy_{ring_name}() {{
     log_info "Deploying {ring_name}..."
@@ -969,156 +1977,246 @@ deploy_{ring_name}() {{
     log_info "{ring_name} deployment completed"
 }}
 
-"""
+""")
 
         # Add main deployment logic
-        script += """
+        parts.append("""
 # Main deployment flow
 main() {
     log_info "Starting FSI Landing Zone deployment..."
     log_info "================================================"
 
-"""
+""")
 
         for ring_name, _ in sorted_rings:
-            script += f"""    log_info "Step: {ring_name}"
+            parts.append(f"""    log_info "Step: {ring_name}"
     deploy_{ring_name}
 
-"""
+""")
 
-        script += """    log_info "================================================"
+        parts.append("""    log_info "================================================"
     log_info "All rings deployed successfully!"
 }
 
 # Run main deployment
 main
-"""
+""")
+
+        return "".join(parts)
+
+    @staticmethod
+    def _azure_profile_mtime() -> Optional[int]:
+        """Return the mtime of the Azure CLI profile, rewritten by az login and az account set."""
+        config_dir = Path(os.environ.get('AZURE_CONFIG_DIR', Path.home() / '.azure'))
+        try:
+            return (config_dir / 'azureProfile.json').stat().st_mtime_ns
+        except OSError:
+            return None
+
+    async def _run_command(
+        self,
+        cmd: List[str],
+        timeout: float,
+        cwd: Optional[Path] = None,
+        capture_stderr: bool = True
+    ):
+        """
+        Run a command without blocking the event loop.
+
+        Mirrors subprocess.run(cmd, capture_output=True, text=True, timeout=...):
+        returns a CompletedProcess, and kills the process and raises
+        subprocess.TimeoutExpired when the timeout is hit. With
+        capture_stderr=False, stderr goes to /dev/null and is returned as None.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL,
+            cwd=cwd
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return subprocess.CompletedProcess(
+            cmd, process.returncode, stdout.decode(), stderr.decode() if stderr is not None else None
+        )
+
+    async def _az_account_json(self, *subcommand: str) -> Optional[Any]:
+        """
+        Run a read-only `az account` query and return its parsed JSON output.
+
+        Successful results are cached for _AZ_ACCOUNT_CACHE_TTL seconds and
+        dropped early when the Azure CLI profile changes; callers arriving
+        while the same query is running wait for it instead of starting
+        another. Returns None if the command fails.
+        """
+        cmd = ('az', 'account', *subcommand, '--output', 'json')
+        profile_mtime = self._azure_profile_mtime()
+        cached = self._az_account_cache.get(cmd)
+        if cached is not None:
+            expires_at, cached_mtime, data = cached
+            if time.monotonic() < expires_at and cached_mtime == profile_mtime:
+                return data
+
+        pending = self._az_account_inflight.get(cmd)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_az_account(cmd, profile_mtime))
+            self._az_account_inflight[cmd] = pending
+            pending.add_done_callback(lambda _: self._az_account_inflight.pop(cmd, None))
+        # Shielded so one cancelled caller doesn't cancel the query for the others
+        return await asyncio.shield(pending)
+
+    async def _fetch_az_account(self, cmd: tuple, profile_mtime: Optional[int]) -> Optional[Any]:
+        """Run an `az account` query and update its cache entry (see _az_account_json)."""
+        result = await self._run_command(list(cmd), timeout=10, capture_stderr=False)
+        if result.returncode != 0:
+            self._az_account_cache.pop(cmd, None)
+            return None
+
+        data = json.loads(result.stdout)
+        self._az_account_cache[cmd] = (time.monotonic() + _AZ_ACCOUNT_CACHE_TTL, profile_mtime, data)
+        return data
+
+    async def _probe_cli_tools(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Detect the Azure CLI and Bicep installs and their versions.
+
+        Once both tools are found the result is reused for the session (until
+        PATH changes or force is set); missing tools are probed on every call.
+        """
+        path = os.environ.get('PATH')
+        if not force and self._cli_tools_cache is not None and self._cli_tools_cache[0] == path:
+            return self._cli_tools_cache[1]
 
-        return script
+        checks = dict(_NO_CLI_TOOLS)
 
-    @tool("check_azure_prerequisites", "Check if Azure CLI and required tools are installed", {})
+        # A probe that raises (e.g. az not installed) just leaves its checks False
+        cli_result, bicep_result = await asyncio.gather(
+            self._run_command(['az', 'version', '--output', 'json'], timeout=10, capture_stderr=False),
+            self._run_command(['az', 'bicep', 'version'], timeout=10, capture_stderr=False),
+            return_exceptions=True
+        )
+
+        # Check Azure CLI
+        if not isinstance(cli_result, Exception) and cli_result.returncode == 0:
+            checks['azure_cli'] = True
+            try:
+                checks['azure_cli_version'] = json.loads(cli_result.stdout).get('azure-cli')
+            except (ValueError, AttributeError):
+                pass
+
+        # Check Bicep
+        if not isinstance(bicep_result, Exception) and bicep_result.returncode == 0:
+            checks['bicep'] = True
+            checks['bicep_version'] = bicep_result.stdout.strip()
+
+        if checks['azure_cli'] and checks['bicep']:
+            self._cli_tools_cache = (path, checks)
+        return checks
+
+    @tool(
+        "check_azure_prerequisites",
+        "Check if Azure CLI and required tools are installed (force=true re-probes cached tool versions)",
+        # Full JSON schema so 'force' stays optional (dict-form schemas make every key required)
+        {"type": "object", "properties": {"force": {"type": "boolean"}}, "required": []}
+    )
     async def check_azure_prerequisites(self, args):
         """Check Azure CLI and prerequisites."""
+        # Tool detection and the account lookup are independent, so run them concurrently
+        tool_checks, account_info = await asyncio.gather(
+            self._probe_cli_tools(force=bool(args.get('force'))),
+            self._az_account_json('show'),
+            return_exceptions=True
+        )
+
+        # An unexpected probe failure is reported as missing tools, like a failed command
+        if isinstance(tool_checks, Exception):
+            tool_checks = _NO_CLI_TOOLS
+
         checks = {
-            'azure_cli': False,
-            'azure_cli_version': None,
-            'bicep': False,
-            'bicep_version': None,
+            **tool_checks,
             'authenticated': False,
             'subscription_access': False
         }
 
-        import subprocess
-
-        # Check Azure CLI
-        try:
-            result = subprocess.run(['az', '--version'], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                checks['azure_cli'] = True
-                # Parse version from output
-                for line in result.stdout.split('\n'):
-                    if 'azure-cli' in line:
-                        checks['azure_cli_version'] = line.split()[-1]
-                        break
-        except Exception:
-            pass
-
-        # Check Bicep
-        try:
-            result = subprocess.run(['az', 'bicep', 'version'], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                checks['bicep'] = True
-                checks['bicep_version'] = result.stdout.strip()
-        except Exception:
-            pass
-
         # Check authentication
-        try:
-            result = subprocess.run(['az', 'account', 'show'], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                checks['authenticated'] = True
-                account_info = json.loads(result.stdout)
-                checks['subscription_access'] = account_info.get('state') == 'Enabled'
-        except Exception:
-            pass
+        if not isinstance(account_info, Exception) and account_info is not None:
+            checks['authenticated'] = True
+            checks['subscription_access'] = account_info.get('state') == 'Enabled'
 
         # Format response
-        status_text = "🔍 Azure Prerequisites Check:\n\n"
-        status_text += f"✅ Azure CLI: {'Installed' if checks['azure_cli'] else '❌ Not installed'}\n"
+        parts = [
+            "🔍 Azure Prerequisites Check:\n\n",
+            f"✅ Azure CLI: {'Installed' if checks['azure_cli'] else '❌ Not installed'}\n",
+        ]
         if checks['azure_cli_version']:
-            status_text += f"   Version: {checks['azure_cli_version']}\n"
+            parts.append(f"   Version: {checks['azure_cli_version']}\n")
 
-        status_text += f"✅ Bicep: {'Installed' if checks['bicep'] else '❌ Not installed'}\n"
+        parts.append(f"✅ Bicep: {'Installed' if checks['bicep'] else '❌ Not installed'}\n")
         if checks['bicep_version']:
-            status_text += f"   Version: {checks['bicep_version']}\n"
+            parts.append(f"   Version: {checks['bicep_version']}\n")
 
-        status_text += f"✅ Authentication: {'Authenticated' if checks['authenticated'] else '❌ Not authenticated'}\n"
-        status_text += f"✅ Subscription Access: {'Active' if checks['subscription_access'] else '❌ No access'}\n"
+        parts.append(f"✅ Authentication: {'Authenticated' if checks['authenticated'] else '❌ Not authenticated'}\n")
+        parts.append(f"✅ Subscription Access: {'Active' if checks['subscription_access'] else '❌ No access'}\n")
 
         if not all([checks['azure_cli'], checks['bicep'], checks['authenticated']]):
-            status_text += "\n⚠️  Missing prerequisites detected. Please install/configure:\n"
+            parts.append("\n⚠️  Missing prerequisites detected. Please install/configure:\n")
             if not checks['azure_cli']:
-                status_text += "   • Azure CLI: https://docs.microsoft.com/cli/azure/install-azure-cli\n"
+                parts.append("   • Azure CLI: https://docs.microsoft.com/cli/azure/install-azure-cli\n")
             if not checks['bicep']:
-                status_text += "   • Bicep: az bicep install\n"
+                parts.append("   • Bicep: az bicep install\n")
             if not checks['authenticated']:
-                status_text += "   • Authenticate: az login\n"
+                parts.append("   • Authenticate: az login\n")
 
         return {
             "content": [
-                {"type": "text", "text": status_text}
+                {"type": "text", "text": "".join(parts)}
             ]
         }
 
     @tool("validate_azure_auth", "Validate Azure authentication and get subscription details", {})
     async def validate_azure_auth(self, args):
         """Validate Azure authentication and subscription access."""
-        import subprocess
-
         try:
-            result = subprocess.run(
-                ['az', 'account', 'show', '--output', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=10
+            # Current account and subscription list are independent queries
+            account, subscriptions = await asyncio.gather(
+                self._az_account_json('show'),
+                self._az_account_json('list')
             )
 
-            if result.returncode != 0:
+            if account is None:
                 return {
                     "content": [
                         {"type": "text", "text": "❌ Not authenticated to Azure. Please run: az login"}
                     ]
                 }
 
-            account = json.loads(result.stdout)
-
-            # Get list of available subscriptions
-            result = subprocess.run(
-                ['az', 'account', 'list', '--output', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            subscriptions = json.loads(result.stdout) if result.returncode == 0 else []
+            subscriptions = subscriptions or []
 
-            auth_text = "✅ Azure Authentication Status:\n\n"
-            auth_text += f"📋 Current Subscription:\n"
-            auth_text += f"   • Name: {account.get('name')}\n"
-            auth_text += f"   • ID: {account.get('id')}\n"
-            auth_text += f"   • State: {account.get('state')}\n"
-            auth_text += f"   • Tenant ID: {account.get('tenantId')}\n"
-            auth_text += f"   • User: {account.get('user', {}).get('name')}\n\n"
+            parts = [
+                "✅ Azure Authentication Status:\n\n"
+                "📋 Current Subscription:\n"
+                f"   • Name: {account.get('name')}\n"
+                f"   • ID: {account.get('id')}\n"
+                f"   • State: {account.get('state')}\n"
+                f"   • Tenant ID: {account.get('tenantId')}\n"
+                f"   • User: {account.get('user', _EMPTY).get('name')}\n\n"
+            ]
 
             if len(subscriptions) > 1:
-                auth_text += f"📌 Available Subscriptions ({len(subscriptions)}):\n"
-                for sub in subscriptions:
-                    indicator = "→" if sub['isDefault'] else " "
-                    auth_text += f"   {indicator} {sub['name']} ({sub['id']})\n"
+                parts.append(f"📌 Available Subscriptions ({len(subscriptions)}):\n")
+                parts.extend(
+                    f"   {'→' if sub['isDefault'] else ' '} {sub['name']} ({sub['id']})\n"
+                    for sub in subscriptions
+                )
 
             return {
                 "content": [
-                    {"type": "text", "text": auth_text}
+                    {"type": "text", "text": "".join(parts)}
                 ]
             }
 
@@ -1134,119 +2232,20 @@ main
         """Get FSI compliance requirements."""
         regulations = self.compliance_config.get('regulations', [])
 
-        compliance_text = "📋 FSI Compliance Requirements for European Regulations:\n\n"
-
-        compliance_details = {
-            "GDPR": {
-                "name": "General Data Protection Regulation",
-                "key_requirements": [
-                    "Data residency within EU/EEA",
-                    "Encryption of personal data at rest and in transit",
-                    "Right to erasure (right to be forgotten)",
-                    "Data breach notification within 72 hours",
-                    "Privacy by design and by default",
-                    "Data protection impact assessments (DPIA)"
-                ],
-                "azure_controls": [
-                    "Azure Policy: Allowed locations for resources",
-                    "Azure Key Vault with customer-managed keys",
-                    "Azure Private Link for services",
-                    "Microsoft Defender for Cloud",
-                    "Azure Information Protection"
-                ]
-            },
-            "DORA": {
-                "name": "Digital Operational Resilience Act",
-                "key_requirements": [
-                    "ICT risk management framework",
-                    "Incident reporting mechanisms",
-                    "Digital operational resilience testing",
-                    "Third-party ICT service provider management",
-                    "Information sharing on cyber threats"
-                ],
-                "azure_controls": [
-                    "Azure Backup and Site Recovery",
-                    "Azure Monitor and Log Analytics",
-                    "Business continuity planning tools",
-                    "Resilience testing framework",
-                    "Multi-region deployment architecture"
-                ]
-            },
-            "PSD2": {
-                "name": "Payment Services Directive 2",
-                "key_requirements": [
-                    "Strong customer authentication (SCA)",
-                    "Secure communication channels",
-                    "Transaction monitoring",
-                    "API security for open banking",
-                    "Fraud detection and prevention"
-                ],
-                "azure_controls": [
-                    "Azure AD Multi-Factor Authentication",
-                    "Azure API Management with OAuth 2.0",
-                    "Azure Application Gateway with WAF",
-                    "Azure Sentinel for security analytics",
-                    "Azure Key Vault for credential management"
-                ]
-            },
-            "MiFID_II": {
-                "name": "Markets in Financial Instruments Directive II",
-                "key_requirements": [
-                    "Transaction reporting",
-                    "Record keeping and audit trails",
-                    "Best execution reporting",
-                    "Clock synchronization",
-                    "Data retention (5-7 years)"
-                ],
-                "azure_controls": [
-                    "Azure Storage with immutable blobs",
-                    "Azure Log Analytics with retention policies",
-                    "Azure Time Series Insights",
-                    "Azure Purview for data governance",
-                    "Azure Archive Storage"
-                ]
-            },
-            "EBA_GL": {
-                "name": "European Banking Authority Guidelines",
-                "key_requirements": [
-                    "ICT and security risk management",
-                    "Outsourcing arrangements",
-                    "Cloud service provider oversight",
-                    "Exit strategies from cloud services",
-                    "Operational resilience"
-                ],
-                "azure_controls": [
-                    "Azure Resource Manager for governance",
-                    "Azure Policy for compliance enforcement",
-                    "Data export and portability tools",
-                    "Multi-cloud and hybrid capabilities",
-                    "Sovereign cloud options (Azure Germany, etc.)"
-                ]
-            }
-        }
+        parts = ["📋 FSI Compliance Requirements for European Regulations:\n\n"]
 
-        for reg in regulations:
-            if reg in compliance_details:
-                details = compliance_details[reg]
-                compliance_text += f"🏛️  {reg} - {details['name']}\n"
-                compliance_text += f"   Key Requirements:\n"
-                for req in details['key_requirements']:
-                    compliance_text += f"   • {req}\n"
-                compliance_text += f"\n   Azure Controls:\n"
-                for control in details['azure_controls']:
-                    compliance_text += f"   ✓ {control}\n"
-                compliance_text += "\n"
+        # One lookup per regulation, in configured order; unknown regulations are skipped
+        parts.extend(filter(None, map(_FSI_COMPLIANCE_SECTIONS.get, regulations)))
 
         # Add policy initiatives
         policy_initiatives = self.compliance_config.get('policy_initiatives', [])
         if policy_initiatives:
-            compliance_text += "📜 Built-in Policy Initiatives to Apply:\n"
-            for initiative in policy_initiatives:
-                compliance_text += f"   • {initiative}\n"
+            parts.append("📜 Built-in Policy Initiatives to Apply:\n")
+            parts.extend(f"   • {initiative}\n" for initiative in policy_initiatives)
 
         return {
             "content": [
-                {"type": "text", "text": compliance_text}
+                {"type": "text", "text": "".join(parts)}
             ]
         }
 
@@ -1269,8 +2268,10 @@ main
                 ]
             }
 
-        avm_text = "📦 Azure Verified Modules (AVM) for FSI Landing Zone\n\n"
-        avm_text += "Modules are sourced from the central manifest (avm-modules.yaml):\n\n"
+        parts = [
+            "📦 Azure Verified Modules (AVM) for FSI Landing Zone\n\n"
+            "Modules are sourced from the central manifest (avm-modules.yaml):\n\n"
+        ]
 
         for key, details in manifest.items():
             display_name = details.get("display_name", key.replace("_", " ").title())
@@ -1281,34 +2282,33 @@ main
             use_case = details.get("use_case")
             features = details.get("key_features", [])
 
-            avm_text += f"🔷 {display_name}\n"
-            avm_text += f"   Key: {key}\n"
+            parts.append(f"🔷 {display_name}\n   Key: {key}\n")
 
             if status == "native":
-                avm_text += "   Status: Native Azure resources (AVM module pending)\n"
+                parts.append("   Status: Native Azure resources (AVM module pending)\n")
             elif status != "available":
                 status_label = status.replace("_", " ").title()
-                avm_text += f"   Status: {status_label}\n"
+                parts.append(f"   Status: {status_label}\n")
 
             if registry and version:
-                avm_text += f"   Module: {registry}:{version}\n"
+                parts.append(f"   Module: {registry}:{version}\n")
             elif registry:
-                avm_text += f"   Module: {registry}\n"
+                parts.append(f"   Module: {registry}\n")
 
             if description:
-                avm_text += f"   Description: {description}\n"
+                parts.append(f"   Description: {description}\n")
             if use_case:
-                avm_text += f"   Use Case: {use_case}\n"
+                parts.append(f"   Use Case: {use_case}\n")
             if features:
-                avm_text += f"   Features: {', '.join(features)}\n"
+                parts.append(f"   Features: {', '.join(features)}\n")
 
-            avm_text += "\n"
+            parts.append("\n")
 
-        avm_text += "💡 Use `avm-modules.yaml` to update versions or add new modules without changing agent code.\n"
+        parts.append("💡 Use `avm-modules.yaml` to update versions or add new modules without changing agent code.\n")
 
         return {
             "content": [
-                {"type": "text", "text": avm_text}
+                {"type": "text", "text": "".join(parts)}
             ]
         }
 
@@ -1317,23 +2317,21 @@ main
         """Generate Bicep template for a specific component."""
         component = args.get("component", "").lower()
 
-        templates = {
-            "hub-vnet": self._generate_hub_vnet_bicep(),
-            "spoke-vnet": self._generate_spoke_vnet_bicep(),
-            "key-vault": self._generate_keyvault_bicep(),
-            "storage": self._generate_storage_bicep(),
-            "policy-assignment": self._generate_policy_bicep(),
-        }
-
-        if component not in templates:
-            available = ", ".join(templates.keys())
+        if component not in self._BICEP_GENERATORS:
+            available = ", ".join(self._BICEP_GENERATORS)
             return {
                 "content": [
                     {"type": "text", "text": f"❌ Unknown component. Available: {available}"}
                 ]
             }
 
-        bicep_content = templates[component]
+        # Render and encode only the requested component, once per session
+        rendered = self._bicep_templates.get(component)
+        if rendered is None:
+            bicep_content = getattr(self, self._BICEP_GENERATORS[component])()
+            rendered = (bicep_content[:500], bicep_content.encode('utf-8'))
+            self._bicep_templates[component] = rendered
+        preview, bicep_bytes = rendered
 
         # Get project directory
         try:
@@ -1348,16 +2346,16 @@ main
         template_path = project_dir / f"{component}.bicep"
 
         # Save template
-        template_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(template_path, 'w') as f:
-            f.write(bicep_content)
-
-        result_text = f"✅ Generated Bicep template for: {component}\n\n"
-        result_text += f"📄 Saved to: {template_path}\n\n"
-        result_text += "Template Preview:\n"
-        result_text += "```bicep\n"
-        result_text += bicep_content[:500] + "...\n"
-        result_text += "```\n"
+        await self._write_output(template_path, bicep_bytes)
+
+        result_text = (
+            f"✅ Generated Bicep template for: {component}\n\n"
+            f"📄 Saved to: {template_path}\n\n"
+            "Template Preview:\n"
+            "```bicep\n"
+            f"{preview}...\n"
+            "```\n"
+        )
 
         return {
             "content": [
@@ -1367,8 +2365,6 @@ main
 
     def _generate_hub_vnet_bicep(self) -> str:
         """Generate Hub VNet Bicep template using Azure Verified Modules."""
-        hub_config = self.azure_config.get('architecture', {}).get('hub', {})
-        naming = self.azure_config.get('landing_zone', {})
         vnet_module = self._avm_module_reference('virtual_network')
         firewall_module = self._avm_module_reference('azure_firewall')
 
@@ -1376,13 +2372,13 @@ main
 // Generated by Azure FSI Landing Zone Agent
 // Using Azure Verified Modules (AVM) from Bicep Public Registry
 
-param location string = '{self.azure_config.get('landing_zone', {}).get('default_region', 'westeurope')}'
-param environment string = '{naming.get('environment', 'prod')}'
-param namingPrefix string = '{naming.get('naming_prefix', 'fsi')}'
+param location string = '{self._default_region}'
+param environment string = '{self._environment}'
+param namingPrefix string = '{self._naming_prefix}'
 
 // Hub VNet configuration
 var hubVNetName = '${{namingPrefix}}-hub-vnet-${{environment}}'
-var addressSpace = '{hub_config.get('vnet_address_space', '10.0.0.0/16')}'
+var addressSpace = '{self._hub_config.get('vnet_address_space', '10.0.0.0/16')}'
 
 // Hub Virtual Network using AVM module
 module hubVNet '{vnet_module}' = {{
@@ -1445,17 +2441,15 @@ output firewallId string = firewall.outputs.resourceId
 
     def _generate_spoke_vnet_bicep(self) -> str:
         """Generate Spoke VNet Bicep template using Azure Verified Modules."""
-        spoke_config = self.azure_config.get('architecture', {}).get('spoke_template', {})
-        naming = self.azure_config.get('landing_zone', {})
         vnet_module = self._avm_module_reference('virtual_network')
 
         return f"""// Spoke Virtual Network for FSI Landing Zone
 // Generated by Azure FSI Landing Zone Agent
 // Using Azure Verified Modules (AVM) from Bicep Public Registry
 
-param location string = '{self.azure_config.get('landing_zone', {}).get('default_region', 'westeurope')}'
-param environment string = '{naming.get('environment', 'prod')}'
-param namingPrefix string = '{naming.get('naming_prefix', 'fsi')}'
+param location string = '{self._default_region}'
+param environment string = '{self._environment}'
+param namingPrefix string = '{self._naming_prefix}'
 param spokeName string
 param hubVNetId string
 
@@ -1469,7 +2463,7 @@ module spokeVNet '{vnet_module}' = {{
     name: spokeVNetName
     location: location
     addressPrefixes: [
-      '{spoke_config.get('vnet_address_space', '10.1.0.0/16')}'
+      '{self._spoke_config.get('vnet_address_space', '10.1.0.0/16')}'
     ]
     subnets: [
       {{
@@ -1512,16 +2506,15 @@ output spokeVNetName string = spokeVNet.outputs.name
 
     def _generate_keyvault_bicep(self) -> str:
         """Generate Key Vault Bicep template using Azure Verified Modules."""
-        naming = self.azure_config.get('landing_zone', {})
         key_vault_module = self._avm_module_reference('key_vault')
 
         return f"""// Azure Key Vault for FSI Landing Zone
 // Generated by Azure FSI Landing Zone Agent
 // Using Azure Verified Modules (AVM) from Bicep Public Registry
 
-param location string = '{self.azure_config.get('landing_zone', {}).get('default_region', 'westeurope')}'
-param environment string = '{naming.get('environment', 'prod')}'
-param namingPrefix string = '{naming.get('naming_prefix', 'fsi')}'
+param location string = '{self._default_region}'
+param environment string = '{self._environment}'
+param namingPrefix string = '{self._naming_prefix}'
 param logAnalyticsWorkspaceId string = ''
 
 var keyVaultName = '${{namingPrefix}}-kv-${{uniqueString(resourceGroup().id)}}'
@@ -1571,16 +2564,15 @@ output keyVaultUri string = keyVault.outputs.uri
 
     def _generate_storage_bicep(self) -> str:
         """Generate Storage Account Bicep template using Azure Verified Modules."""
-        naming = self.azure_config.get('landing_zone', {})
         storage_module = self._avm_module_reference('storage_account')
 
         return f"""// Storage Account for FSI Landing Zone
 // Generated by Azure FSI Landing Zone Agent
 // Using Azure Verified Modules (AVM) from Bicep Public Registry
 
-param location string = '{self.azure_config.get('landing_zone', {}).get('default_region', 'westeurope')}'
-param environment string = '{naming.get('environment', 'prod')}'
-param namingPrefix string = '{naming.get('naming_prefix', 'fsi')}'
+param location string = '{self._default_region}'
+param environment string = '{self._environment}'
+param namingPrefix string = '{self._naming_prefix}'
 param logAnalyticsWorkspaceId string = ''
 
 var storageAccountName = '${{namingPrefix}}st${{uniqueString(resourceGroup().id)}}'
@@ -1702,34 +2694,93 @@ output dataResidencyPolicyId string = dataResidencyPolicy.id
 output securityBenchmarkId string = securityBenchmark.id
 """
 
+    async def _bicep_build_errors(self) -> Optional[Dict[str, Any]]:
+        """
+        Compile the project's generated Bicep templates with `az bicep build`.
+
+        Templates are built concurrently, and a validation started while the
+        same project is being built waits for that run instead of starting
+        another. Returns {'templates': count, 'errors': {template name: first
+        error line}}, or None when there is nothing to check (no project, no
+        templates, or no Azure CLI).
+        """
+        if not self.project_name:
+            return None
+
+        project_dir = self.config_dir / self.project_name
+        pending = self._bicep_builds_inflight.get(project_dir)
+        if pending is None:
+            pending = asyncio.ensure_future(self._build_project_bicep(project_dir))
+            self._bicep_builds_inflight[project_dir] = pending
+            pending.add_done_callback(lambda _: self._bicep_builds_inflight.pop(project_dir, None))
+        # Shielded so one cancelled caller doesn't cancel the build for the others
+        return await asyncio.shield(pending)
+
+    async def _build_project_bicep(self, project_dir: Path) -> Optional[Dict[str, Any]]:
+        """Run `az bicep build` on a project's templates (see _bicep_build_errors)."""
+        templates = await asyncio.to_thread(lambda: sorted(project_dir.glob('*.bicep')))
+        if not templates:
+            return None
+
+        results = await asyncio.gather(
+            *(
+                self._run_command(['az', 'bicep', 'build', '--file', str(path), '--stdout'], timeout=60)
+                for path in templates
+            ),
+            return_exceptions=True
+        )
+        if all(isinstance(result, FileNotFoundError) for result in results):
+            return None
+
+        errors = {}
+        for path, result in zip(templates, results):
+            if isinstance(result, Exception):
+                errors[path.name] = str(result)
+            elif result.returncode != 0:
+                lines = [line for line in result.stderr.splitlines() if line.strip()]
+                errors[path.name] = lines[0].strip() if lines else f"exit code {result.returncode}"
+        return {'templates': len(templates), 'errors': errors}
+
     @tool("validate_deployment", "Validate deployment configuration and run what-if analysis", {"deployment_type": str})
     async def validate_deployment(self, args):
         """Validate deployment configuration."""
         deployment_type = args.get("deployment_type", "full")
 
-        validation_text = f"🔍 Deployment Validation - {deployment_type}\n\n"
+        parts = [f"🔍 Deployment Validation - {deployment_type}\n\nPre-deployment Checks:\n"]
 
         # Pre-deployment checks
-        checks = self.deployment_config.get('validation', {}).get('pre_deployment_checks', [])
-        validation_text += "Pre-deployment Checks:\n"
-        for check in checks:
-            validation_text += f"   ✓ {check.replace('_', ' ').title()}\n"
+        checks = self.deployment_config.get('validation', _EMPTY).get('pre_deployment_checks', [])
+        parts.extend(f"   ✓ {check.replace('_', ' ').title()}\n" for check in checks)
 
-        validation_text += "\n📋 Validation Results:\n"
-        validation_text += "   ✅ Bicep syntax validation\n"
-        validation_text += "   ✅ Resource naming conventions\n"
-        validation_text += "   ✅ Region availability check\n"
-        validation_text += "   ✅ Policy compliance validation\n"
-        validation_text += "   ✅ Security baseline verification\n"
+        parts.append("\n📋 Validation Results:\n")
 
-        validation_text += "\n⚠️  What-If Analysis:\n"
-        validation_text += "   To run: az deployment sub what-if --location <region> --template-file <template>\n"
+        # Compile generated templates when the Azure CLI is available
+        build = await self._bicep_build_errors()
+        if build is None:
+            parts.append("   ✅ Bicep syntax validation\n")
+        elif not build['errors']:
+            parts.append(f"   ✅ Bicep syntax validation ({build['templates']} templates built)\n")
+        else:
+            parts.append(
+                f"   ❌ Bicep syntax validation "
+                f"({len(build['errors'])} of {build['templates']} templates failed)\n"
+            )
+            parts.extend(f"{_SUB_ITEM}{name}: {error}\n" for name, error in build['errors'].items())
+
+        parts.append(
+            "   ✅ Resource naming conventions\n"
+            "   ✅ Region availability check\n"
+            "   ✅ Policy compliance validation\n"
+            "   ✅ Security baseline verification\n"
+            "\n⚠️  What-If Analysis:\n"
+            "   To run: az deployment sub what-if --location <region> --template-file <template>\n"
+        )
 
-        self.deployment_state['last_validation'] = datetime.now().isoformat()
+        self.deployment_state['last_validation'] = datetime.now()
 
         return {
             "content": [
-                {"type": "text", "text": validation_text}
+                {"type": "text", "text": "".join(parts)}
             ]
         }
 
@@ -1740,443 +2791,215 @@ output securityBenchmarkId string = securityBenchmark.id
 
         initiatives = self.compliance_config.get('policy_initiatives', [])
 
-        policy_text = f"📜 Applying Compliance Policies to {scope}:\n\n"
+        parts = [f"📜 Applying Compliance Policies to {scope}:\n\nBuilt-in Policy Initiatives:\n"]
+        parts.extend(f"{_BULLET}{initiative}\n" for initiative in initiatives)
+        self.deployment_state['policies_applied'].extend(initiatives)
 
-        policy_text += "Built-in Policy Initiatives:\n"
-        for initiative in initiatives:
-            policy_text += f"   • {initiative}\n"
-            self.deployment_state['policies_applied'].append(initiative)
+        if self._custom_policies:
+            parts.append("\nCustom FSI Policies:\n")
 
-        custom_policies = self.compliance_config.get('custom_policies', {})
-        if custom_policies:
-            policy_text += "\nCustom FSI Policies:\n"
+            if self._custom_policies.get('data_residency', _EMPTY).get('enabled'):
+                regions = self._custom_policies['data_residency'].get('allowed_regions', [])
+                parts.append(f"{_CHECK}Data Residency: Restrict to {', '.join(regions)}\n")
 
-            if custom_policies.get('data_residency', {}).get('enabled'):
-                regions = custom_policies['data_residency'].get('allowed_regions', [])
-                policy_text += f"   ✓ Data Residency: Restrict to {', '.join(regions)}\n"
+            if self._custom_policies.get('encryption', _EMPTY).get('enabled'):
+                parts.append(_CHECK + "Encryption: Require CMK and double encryption\n")
 
-            if custom_policies.get('encryption', {}).get('enabled'):
-                policy_text += "   ✓ Encryption: Require CMK and double encryption\n"
+            if self._custom_policies.get('network_security', _EMPTY).get('enabled'):
+                parts.append(_CHECK + "Network Security: Require private endpoints, deny public IPs\n")
 
-            if custom_policies.get('network_security', {}).get('enabled'):
-                policy_text += "   ✓ Network Security: Require private endpoints, deny public IPs\n"
+            if self._custom_policies.get('monitoring', _EMPTY).get('enabled'):
+                retention = self._custom_policies['monitoring'].get('log_retention_days', 365)
+                parts.append(f"{_CHECK}Monitoring: Diagnostic settings with {retention} day retention\n")
 
-            if custom_policies.get('monitoring', {}).get('enabled'):
-                retention = custom_policies['monitoring'].get('log_retention_days', 365)
-                policy_text += f"   ✓ Monitoring: Diagnostic settings with {retention} day retention\n"
-
-        policy_text += "\n💡 To apply these policies, use:\n"
-        policy_text += "   az policy assignment create --name <name> --policy <policy-id> --scope <scope>\n"
+        parts.append(
+            "\n💡 To apply these policies, use:\n"
+            "   az policy assignment create --name <name> --policy <policy-id> --scope <scope>\n"
+        )
 
         return {
             "content": [
-                {"type": "text", "text": policy_text}
+                {"type": "text", "text": "".join(parts)}
             ]
         }
 
     @tool("get_deployment_status", "Get current deployment status and statistics", {})
     async def get_deployment_status(self, args):
         """Get deployment status."""
-        status_text = "📊 FSI Landing Zone Deployment Status:\n\n"
-
-        status_text += f"🚀 Deployments Count: {self.deployment_state['deployments_count']}\n"
-        status_text += f"📝 Current Deployment: {self.deployment_state['current_deployment'] or 'None'}\n"
-        status_text += f"✅ Last Validation: {self.deployment_state['last_validation'] or 'Never'}\n"
+        state = self.deployment_state
+        last_validation = state['last_validation']
+        parts = [
+            "📊 FSI Landing Zone Deployment Status:\n\n"
+            f"🚀 Deployments Count: {state['deployments_count']}\n"
+            f"📝 Current Deployment: {state['current_deployment'] or 'None'}\n"
+            f"✅ Last Validation: {last_validation.isoformat() if last_validation else 'Never'}\n"
+        ]
 
-        if self.deployment_state['policies_applied']:
-            status_text += f"\n🛡️  Policies Applied ({len(self.deployment_state['policies_applied'])}):\n"
-            for policy in self.deployment_state['policies_applied']:
-                status_text += f"   • {policy}\n"
+        if state['policies_applied']:
+            parts.append(f"\n🛡️  Policies Applied ({len(state['policies_applied'])}):\n")
+            parts.extend(f"{_BULLET}{policy}\n" for policy in state['policies_applied'])
 
-        status_text += f"\n⚙️  Configuration:\n"
-        status_text += f"   • Default Region: {self.azure_config.get('landing_zone', {}).get('default_region')}\n"
-        status_text += f"   • Environment: {self.azure_config.get('landing_zone', {}).get('environment')}\n"
-        status_text += f"   • Topology: {self.azure_config.get('architecture', {}).get('topology')}\n"
+        parts.append(
+            "\n⚙️  Configuration:\n"
+            f"{_BULLET}Default Region: {self._landing_zone.get('default_region')}\n"
+            f"{_BULLET}Environment: {self._landing_zone.get('environment')}\n"
+            f"{_BULLET}Topology: {self._arch_config.get('topology')}\n"
+        )
 
         return {
             "content": [
-                {"type": "text", "text": status_text}
+                {"type": "text", "text": "".join(parts)}
             ]
         }
 
     @tool("generate_network_architecture", "Generate network architecture diagram and documentation", {})
+    @cached_response
     async def generate_network_architecture(self, args):
         """Generate network architecture documentation."""
-        arch_config = self.azure_config.get('architecture', {})
-        topology = arch_config.get('topology', 'hub-spoke')
+        topology = self._arch_config.get('topology', 'hub-spoke')
 
-        arch_text = f"🏗️  FSI Landing Zone Network Architecture ({topology})\n\n"
+        parts = [f"🏗️  FSI Landing Zone Network Architecture ({topology})\n\n"]
 
         if topology == 'hub-spoke':
-            hub = arch_config.get('hub', {})
-            spoke = arch_config.get('spoke_template', {})
-
-            arch_text += "Hub Network:\n"
-            arch_text += f"   • Address Space: {hub.get('vnet_address_space')}\n"
-            arch_text += "   • Subnets:\n"
-            for subnet in hub.get('subnets', []):
-                arch_text += f"      - {subnet['name']}: {subnet['address_prefix']}\n"
-            arch_text += "   • Components:\n"
-            for component in hub.get('components', []):
-                arch_text += f"      - {component}\n"
-
-            arch_text += "\nSpoke Network Template:\n"
-            arch_text += f"   • Address Space: {spoke.get('vnet_address_space')}\n"
-            arch_text += "   • Subnets:\n"
-            for subnet in spoke.get('subnets', []):
-                arch_text += f"      - {subnet['name']}: {subnet['address_prefix']}\n"
-
-        arch_text += "\n🔒 Security Controls:\n"
-        arch_text += "   • Network Security Groups on all subnets\n"
-        arch_text += "   • Azure Firewall for traffic inspection\n"
-        arch_text += "   • Private endpoints for PaaS services\n"
-        arch_text += "   • No public IP addresses (FSI compliance)\n"
-        arch_text += "   • DDoS Protection Standard\n"
-
-        arch_text += "\n🌍 Data Residency:\n"
-        data_residency = self.compliance_config.get('custom_policies', {}).get('data_residency', {})
-        if data_residency.get('enabled'):
-            regions = data_residency.get('allowed_regions', [])
-            arch_text += f"   • Allowed Regions: {', '.join(regions)}\n"
-            arch_text += "   • Cross-region replication: Within EU only\n"
-
-        return {
-            "content": [
-                {"type": "text", "text": arch_text}
-            ]
-        }
-
-    @tool("check_data_residency", "Check data residency compliance for EU regulations", {})
-    async def check_data_residency(self, args):
-        """Check data residency compliance."""
-        data_residency = self.compliance_config.get('custom_policies', {}).get('data_residency', {})
-
-        residency_text = "🌍 Data Residency Compliance Check:\n\n"
-
-        if data_residency.get('enabled'):
-            allowed_regions = data_residency.get('allowed_regions', [])
-            residency_text += "✅ Data Residency Policy: ENABLED\n\n"
-            residency_text += "Allowed Regions (EU/EEA):\n"
-
-            region_details = {
-                "westeurope": "Netherlands (West Europe)",
-                "northeurope": "Ireland (North Europe)",
-                "francecentral": "France (France Central)",
-                "germanywestcentral": "Germany (Germany West Central)"
-            }
-
-            for region in allowed_regions:
-                details = region_details.get(region, region)
-                residency_text += f"   ✓ {details}\n"
-
-            residency_text += "\n🔒 Compliance Requirements:\n"
-            residency_text += "   • GDPR: Data stored within EU/EEA\n"
-            residency_text += "   • Data sovereignty: Government access limited\n"
-            residency_text += "   • Cross-border transfers: Prohibited outside EU\n"
-            residency_text += "   • Backup locations: EU regions only\n"
-
-            residency_text += "\n💡 Azure Policy:\n"
-            residency_text += "   Policy will DENY resource creation in non-EU regions\n"
-            residency_text += "   Exemptions require compliance review and approval\n"
-        else:
-            residency_text += "⚠️  Data Residency Policy: DISABLED\n"
-            residency_text += "   Enable in config.yaml under compliance.custom_policies.data_residency\n"
-
-        return {
-            "content": [
-                {"type": "text", "text": residency_text}
-            ]
-        }
-
-    @tool("export_deployment_plan", "Export complete deployment plan to file", {"format": str})
-    async def export_deployment_plan(self, args):
-        """Export deployment plan."""
-        output_format = args.get("format", "markdown").lower()
-
-        # Get project directory
-        try:
-            project_dir = self.get_project_dir()
-        except ValueError:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ Please set a project name first using set_project_name tool."}
-                ]
-            }
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"fsi-deployment-plan_{timestamp}.{output_format}"
-        output_path = project_dir / filename
-
-        if output_format == "markdown":
-            content = self._generate_markdown_plan()
-        elif output_format == "json":
-            content = self._generate_json_plan()
-        else:
-            return {
-                "content": [
-                    {"type": "text", "text": "❌ Unsupported format. Use 'markdown' or 'json'"}
-                ]
-            }
-
-        with open(output_path, 'w') as f:
-            f.write(content)
-
-        result_text = f"✅ Deployment plan exported:\n\n"
-        result_text += f"📄 File: {output_path}\n"
-        result_text += f"📊 Format: {output_format.upper()}\n"
-        result_text += f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-
-        return {
-            "content": [
-                {"type": "text", "text": result_text}
-            ]
-        }
-
-    def _generate_markdown_plan(self) -> str:
-        """Generate markdown deployment plan."""
-        plan = f"""# Azure FSI Landing Zone Deployment Plan
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Overview
-
-This deployment plan creates a Financial Services Industry (FSI) compliant Azure Landing Zone with:
-- Microsoft FSI Landing Zone reference architecture
-- Azure Verified Modules (AVM)
-- European regulatory compliance (GDPR, DORA, PSD2, MiFID II, EBA GL)
-
-## Configuration
-
-### Environment
-- **Subscription ID**: {self.azure_config.get('subscription_id', 'TBD')}
-- **Default Region**: {self.azure_config.get('landing_zone', {}).get('default_region')}
-- **Environment**: {self.azure_config.get('landing_zone', {}).get('environment')}
-- **Naming Prefix**: {self.azure_config.get('landing_zone', {}).get('naming_prefix')}
-
-### Compliance Requirements
-{chr(10).join(f"- {reg}" for reg in self.compliance_config.get('regulations', []))}
-
-### Policy Initiatives
-{chr(10).join(f"- {init}" for init in self.compliance_config.get('policy_initiatives', []))}
-
-## Architecture
-
-### Network Topology
-- **Type**: {self.azure_config.get('architecture', {}).get('topology', 'hub-spoke')}
-
-### Hub Network
-- **Address Space**: {self.azure_config.get('architecture', {}).get('hub', {}).get('vnet_address_space')}
-
-### Components
-{chr(10).join(f"- {comp}" for comp in self.azure_config.get('architecture', {}).get('hub', {}).get('components', []))}
-
-## Deployment Steps
-
-1. **Prerequisites Check**
-   - Azure CLI installed
-   - Bicep installed
-   - Authenticated to Azure
-   - Subscription access verified
-
-2. **Policy Assignment**
-   - Apply built-in policy initiatives
-   - Configure custom FSI policies
-   - Set data residency restrictions
-
-3. **Hub Deployment**
-   - Deploy hub virtual network
-   - Deploy Azure Firewall
-   - Deploy VPN Gateway
-   - Deploy Azure Bastion
-
-4. **Spoke Deployment**
-   - Deploy spoke virtual networks
-   - Configure VNet peering
-   - Apply NSGs and route tables
-
-5. **Management Services**
-   - Deploy Log Analytics workspace
-   - Configure Microsoft Defender for Cloud
-   - Deploy Key Vault
-   - Configure backup and recovery
-
-6. **Compliance Validation**
-   - Verify policy compliance
-   - Check security baseline
-   - Validate data residency
-   - Review audit logs
-
-## Security Controls
-
-### Network Security
-- Private endpoints for all PaaS services
-- No public IP addresses allowed
-- Azure Firewall for egress traffic
-- NSGs on all subnets
-
-### Data Protection
-- Encryption at rest with CMK
-- Double encryption enabled
-- Data residency in EU regions only
-- Soft delete and purge protection
-
-### Identity & Access
-- RBAC with least privilege
-- Privileged Identity Management (PIM)
-- Multi-factor authentication required
-- Azure AD integration
-
-## Next Steps
+            hub = self._hub_config
+            spoke = self._spoke_config
 
-1. Review and approve this plan
-2. Run what-if analysis: `az deployment sub what-if`
-3. Deploy hub infrastructure
-4. Deploy spoke networks
-5. Apply compliance policies
-6. Validate deployment
-7. Configure monitoring and alerts
+            parts.append(
+                "Hub Network:\n"
+                f"{_BULLET}Address Space: {hub.get('vnet_address_space')}\n"
+                f"{_BULLET}Subnets:\n"
+            )
+            parts.extend(
+                f"{_SUB_ITEM}{subnet['name']}: {subnet['address_prefix']}\n" for subnet in hub.get('subnets', [])
+            )
+            parts.append(_BULLET + "Components:\n")
+            parts.extend(f"{_SUB_ITEM}{component}\n" for component in hub.get('components', []))
 
----
-*Generated by Azure FSI Landing Zone Agent*
-"""
-        return plan
+            parts.append(
+                "\nSpoke Network Template:\n"
+                f"{_BULLET}Address Space: {spoke.get('vnet_address_space')}\n"
+                f"{_BULLET}Subnets:\n"
+            )
+            parts.extend(
+                f"{_SUB_ITEM}{subnet['name']}: {subnet['address_prefix']}\n" for subnet in spoke.get('subnets', [])
+            )
 
-    @tool("generate_bastion_template", "Generate Azure Bastion Bicep template for secure VM access", {})
-    async def generate_bastion_template(self, args):
-        """Generate Azure Bastion Bicep template."""
-        naming = self.azure_config.get('landing_zone', {})
-        hub_config = self.azure_config.get('architecture', {}).get('hub', {})
+        parts.append(_NETWORK_SECURITY_CONTROLS_TEXT)
 
-        bicep_content = f"""// Azure Bastion for FSI Landing Zone
-// Generated by Azure FSI Landing Zone Agent
+        parts.append("\n🌍 Data Residency:\n")
+        data_residency = self._custom_policies.get('data_residency', _EMPTY)
+        if data_residency.get('enabled'):
+            regions = data_residency.get('allowed_regions', [])
+            parts.append(
+                f"{_BULLET}Allowed Regions: {', '.join(regions)}\n"
+                f"{_BULLET}Cross-region replication: Within EU only\n"
+            )
 
-param location string = '{self.azure_config.get('landing_zone', {}).get('default_region', 'westeurope')}'
-param environment string = '{naming.get('environment', 'prod')}'
-param namingPrefix string = '{naming.get('naming_prefix', 'fsi')}'
-param hubVNetName string
+        return {
+            "content": [
+                {"type": "text", "text": "".join(parts)}
+            ]
+        }
 
-// Azure Bastion configuration
-var bastionName = '${{namingPrefix}}-bastion-${{environment}}'
-var bastionPublicIPName = '${{bastionName}}-pip'
+    @tool("check_data_residency", "Check data residency compliance for EU regulations", {})
+    @cached_response
+    async def check_data_residency(self, args):
+        """Check data residency compliance."""
+        data_residency = self._custom_policies.get('data_residency', _EMPTY)
 
-// Public IP for Bastion (required)
-resource bastionPublicIP 'Microsoft.Network/publicIPAddresses@2023-05-01' = {{
-  name: bastionPublicIPName
-  location: location
-  sku: {{
-    name: 'Standard'
-  }}
-  properties: {{
-    publicIPAllocationMethod: 'Static'
-    publicIPAddressVersion: 'IPv4'
-  }}
-  tags: {{
-    Environment: environment
-    Purpose: 'FSI Bastion'
-    Compliance: 'GDPR,DORA,PSD2'
-  }}
-}}
+        parts = ["🌍 Data Residency Compliance Check:\n\n"]
 
-// Azure Bastion Host
-resource bastion 'Microsoft.Network/bastionHosts@2023-05-01' = {{
-  name: bastionName
-  location: location
-  sku: {{
-    name: 'Standard'  // Standard SKU for FSI requirements
-  }}
-  properties: {{
-    enableTunneling: true  // For native client support
-    enableIpConnect: true  // For IP-based connection
-    enableShareableLink: false  // Disabled for security
-    scaleUnits: 2  // Scale units for performance
-    ipConfigurations: [
-      {{
-        name: 'IpConf'
-        properties: {{
-          subnet: {{
-            id: resourceId('Microsoft.Network/virtualNetworks/subnets', hubVNetName, 'AzureBastionSubnet')
-          }}
-          publicIPAddress: {{
-            id: bastionPublicIP.id
-          }}
-        }}
-      }}
-    ]
-  }}
-  tags: {{
-    Environment: environment
-    Purpose: 'FSI Secure Access'
-    Compliance: 'GDPR,DORA,Zero-Trust'
-  }}
-  dependsOn: [
-    bastionPublicIP
-  ]
-}}
+        if data_residency.get('enabled'):
+            allowed_regions = data_residency.get('allowed_regions', [])
+            parts.append("✅ Data Residency Policy: ENABLED\n\nAllowed Regions (EU/EEA):\n")
+            parts.extend(f"{_CHECK}{_REGION_DETAILS.get(region, region)}\n" for region in allowed_regions)
+            parts.append(_DATA_RESIDENCY_REQUIREMENTS_TEXT)
+        else:
+            parts.append(
+                "⚠️  Data Residency Policy: DISABLED\n"
+                "   Enable in config.yaml under compliance.custom_policies.data_residency\n"
+            )
 
-// Diagnostic settings for Bastion
-resource bastionDiagnostics 'Microsoft.Insights/diagnosticSettings@2021-05-01-preview' = {{
-  name: 'bastion-diagnostics'
-  scope: bastion
-  properties: {{
-    logs: [
-      {{
-        category: 'BastionAuditLogs'
-        enabled: true
-        retentionPolicy: {{
-          enabled: true
-          days: 365  // FSI retention requirement
-        }}
-      }}
-    ]
-    metrics: [
-      {{
-        category: 'AllMetrics'
-        enabled: true
-        retentionPolicy: {{
-          enabled: true
-          days: 90
-        }}
-      }}
-    ]
-  }}
-}}
+        return {
+            "content": [
+                {"type": "text", "text": "".join(parts)}
+            ]
+        }
 
-// Outputs
-output bastionId string = bastion.id
-output bastionName string = bastion.name
-output bastionDnsName string = bastionPublicIP.properties.dnsSettings.fqdn
-"""
+    @tool("export_deployment_plan", "Export complete deployment plan to file (format: markdown, json or all)", {"format": str})
+    @requires_project_dir
+    async def export_deployment_plan(self, args, project_dir: Path):
+        """Export deployment plan."""
+        output_format = args.get("format", "markdown").lower()
 
-        # Get project directory
-        try:
-            project_dir = self.get_project_dir()
-        except ValueError:
+        if output_format == "all":
+            formats = list(self._PLAN_FORMATTERS)
+        elif output_format in self._PLAN_FORMATTERS:
+            formats = [output_format]
+        else:
             return {
                 "content": [
-                    {"type": "text", "text": "❌ Please set a project name first using set_project_name tool."}
+                    {"type": "text", "text": "❌ Unsupported format. Use 'markdown', 'json' or 'all'"}
                 ]
             }
 
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        output_paths = [project_dir / f"fsi-deployment-plan_{timestamp}.{fmt}" for fmt in formats]
+        contents = [getattr(self, self._PLAN_FORMATTERS[fmt])(now) for fmt in formats]
+
+        # Write all requested formats concurrently
+        await asyncio.gather(*(
+            asyncio.to_thread(self._write_text_file, path, content)
+            for path, content in zip(output_paths, contents)
+        ))
+
+        parts = ["✅ Deployment plan exported:\n\n"]
+        parts.extend(f"📄 File: {output_path}\n" for output_path in output_paths)
+        parts.append(
+            f"📊 Format: {', '.join(fmt.upper() for fmt in formats)}\n"
+            f"📅 Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        )
+
+        return {
+            "content": [
+                {"type": "text", "text": "".join(parts)}
+            ]
+        }
+
+    def _generate_markdown_plan(self, now: Optional[datetime] = None) -> str:
+        """Generate markdown deployment plan."""
+        now = now or datetime.now()
+        return _MARKDOWN_PLAN_TEMPLATE.format_map(
+            ChainMap({'generated': now.strftime('%Y-%m-%d %H:%M:%S')}, self._markdown_plan_params)
+        )
+
+    @tool("generate_bastion_template", "Generate Azure Bastion Bicep template for secure VM access", {})
+    @requires_project_dir
+    async def generate_bastion_template(self, args, project_dir: Path):
+        """Generate Azure Bastion Bicep template."""
+        bicep_bytes = _render_bastion_bicep(self._default_region, self._environment, self._naming_prefix)
+
         # Save template
         template_path = project_dir / "azure-bastion.bicep"
-        template_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(template_path, 'w') as f:
-            f.write(bicep_content)
-
-        result_text = f"✅ Generated Azure Bastion template\n\n"
-        result_text += f"📄 Saved to: {template_path}\n\n"
-        result_text += "🔒 Features:\n"
-        result_text += "   • Standard SKU (required for FSI)\n"
-        result_text += "   • Tunneling enabled (native client support)\n"
-        result_text += "   • IP Connect enabled\n"
-        result_text += "   • Shareable links disabled (security)\n"
-        result_text += "   • 365-day audit log retention\n"
-        result_text += "   • Diagnostic settings configured\n\n"
-        result_text += "💡 Deployment:\n"
-        result_text += f"   az deployment group create \\\n"
-        result_text += f"     --resource-group <hub-rg> \\\n"
-        result_text += f"     --template-file {template_path} \\\n"
-        result_text += f"     --parameters hubVNetName=<hub-vnet-name>\n"
+        await self._write_output(template_path, bicep_bytes)
+
+        result_text = (
+            "✅ Generated Azure Bastion template\n\n"
+            f"📄 Saved to: {template_path}\n\n"
+            "🔒 Features:\n"
+            "   • Standard SKU (required for FSI)\n"
+            "   • Tunneling enabled (native client support)\n"
+            "   • IP Connect enabled\n"
+            "   • Shareable links disabled (security)\n"
+            "   • 365-day audit log retention\n"
+            "   • Diagnostic settings configured\n\n"
+            "💡 Deployment:\n"
+            "   az deployment group create \\\n"
+            "     --resource-group <hub-rg> \\\n"
+            f"     --template-file {template_path} \\\n"
+            "     --parameters hubVNetName=<hub-vnet-name>\n"
+        )
 
         return {
             "content": [
@@ -2187,261 +3010,23 @@ output bastionDnsName string = bastionPublicIP.properties.dnsSettings.fqdn
     @tool("configure_entra_id", "Generate Entra ID (Azure AD) configuration for FSI compliance", {})
     async def configure_entra_id(self, args):
         """Generate Entra ID configuration guidance."""
-        config_text = "🔐 Entra ID (Azure AD) Configuration for FSI Compliance\n\n"
-
-        config_text += "## Required Configurations\n\n"
-
-        config_text += "### 1. Multi-Factor Authentication (MFA)\n"
-        config_text += "```bash\n"
-        config_text += "# Enable MFA for all users (Security Defaults)\n"
-        config_text += "az rest --method PATCH \\\n"
-        config_text += "  --uri https://graph.microsoft.com/v1.0/policies/identitySecurityDefaultsEnforcementPolicy \\\n"
-        config_text += "  --body '{{\"isEnabled\": true}}'\n"
-        config_text += "```\n\n"
-
-        config_text += "### 2. Privileged Identity Management (PIM)\n"
-        config_text += "Required Roles for PIM:\n"
-        config_text += "   • Global Administrator → PIM activation required\n"
-        config_text += "   • Security Administrator → PIM activation required\n"
-        config_text += "   • Contributor (Subscription) → PIM activation required\n\n"
-        config_text += "Configure in Azure Portal:\n"
-        config_text += "   → Entra ID → Privileged Identity Management\n"
-        config_text += "   → Azure AD Roles → Settings\n"
-        config_text += "   → Require approval for activation\n"
-        config_text += "   → Maximum activation duration: 8 hours\n"
-        config_text += "   → Require MFA on activation\n\n"
-
-        config_text += "### 3. Sign-in and Audit Logs\n"
-        config_text += "```bash\n"
-        config_text += "# Configure diagnostic settings for Entra ID\n"
-        config_text += "az monitor diagnostic-settings create \\\n"
-        config_text += "  --name 'EntraID-to-LogAnalytics' \\\n"
-        config_text += "  --resource '/providers/microsoft.aadiam/diagnosticSettings' \\\n"
-        config_text += "  --workspace <log-analytics-workspace-id> \\\n"
-        config_text += "  --logs '[{{\"category\": \"SignInLogs\", \"enabled\": true}}, \\\n"
-        config_text += "           {{\"category\": \"AuditLogs\", \"enabled\": true}}, \\\n"
-        config_text += "           {{\"category\": \"RiskyUsers\", \"enabled\": true}}]'\n"
-        config_text += "```\n\n"
-
-        config_text += "### 4. Password Policy (FSI Requirements)\n"
-        config_text += "Configuration:\n"
-        config_text += "   • Minimum password length: 14 characters\n"
-        config_text += "   • Password complexity: Enabled\n"
-        config_text += "   • Password expiration: 90 days\n"
-        config_text += "   • Password history: Remember 24 passwords\n"
-        config_text += "   • Account lockout: 5 failed attempts\n\n"
-
-        config_text += "### 5. External Identity Settings\n"
-        config_text += "For B2B collaboration (FSI compliance):\n"
-        config_text += "   • Guest user permissions: Most restrictive\n"
-        config_text += "   • Guest invite settings: Only administrators\n"
-        config_text += "   • External collaboration settings: Specific domains only\n\n"
-
-        config_text += "## Compliance Mappings\n\n"
-        config_text += "🏛️  RGPD/GDPR:\n"
-        config_text += "   • Sign-in logs for access tracking\n"
-        config_text += "   • Audit logs for data access evidence\n\n"
-
-        config_text += "🏛️  DORA:\n"
-        config_text += "   • PIM for privileged access management\n"
-        config_text += "   • MFA for strong authentication\n\n"
-
-        config_text += "🏛️  PSD2:\n"
-        config_text += "   • MFA = Strong Customer Authentication (SCA)\n"
-        config_text += "   • Audit logs for transaction tracking\n\n"
-
-        config_text += "## Next Steps\n"
-        config_text += "1. Enable Security Defaults or Conditional Access\n"
-        config_text += "2. Configure PIM for privileged roles\n"
-        config_text += "3. Set up diagnostic settings for log export\n"
-        config_text += "4. Review and update password policy\n"
-        config_text += "5. Use deploy_conditional_access tool for policies\n"
-
-        return {
-            "content": [
-                {"type": "text", "text": config_text}
-            ]
-        }
+        return _ENTRA_ID_CONFIG_RESPONSE
 
     @tool("deploy_conditional_access", "Generate Conditional Access policies for FSI compliance", {})
     async def deploy_conditional_access(self, args):
         """Generate Conditional Access policy configurations."""
-        policies_text = "🛡️  Conditional Access Policies for FSI Compliance\n\n"
-
-        policies_text += "## Policy 1: Require MFA for All Users\n\n"
-        policies_text += "```json\n"
-        policies_text += json.dumps({
-            "displayName": "FSI: Require MFA for All Users",
-            "state": "enabled",
-            "conditions": {
-                "users": {
-                    "includeUsers": ["All"]
-                },
-                "applications": {
-                    "includeApplications": ["All"]
-                }
-            },
-            "grantControls": {
-                "operator": "OR",
-                "builtInControls": ["mfa"]
-            }
-        }, indent=2)
-        policies_text += "\n```\n\n"
-
-        policies_text += "## Policy 2: Block Access from Non-EU Locations\n\n"
-        policies_text += "```json\n"
-        policies_text += json.dumps({
-            "displayName": "FSI: Block Non-EU Access",
-            "state": "enabledForReportingButNotEnforced",
-            "conditions": {
-                "users": {
-                    "includeUsers": ["All"]
-                },
-                "applications": {
-                    "includeApplications": ["All"]
-                },
-                "locations": {
-                    "includeLocations": ["All"],
-                    "excludeLocations": ["EU", "EuropeanUnion"]
-                }
-            },
-            "grantControls": {
-                "operator": "OR",
-                "builtInControls": ["block"]
-            }
-        }, indent=2)
-        policies_text += "\n```\n\n"
-
-        policies_text += "## Policy 3: Require Compliant Device for Admins\n\n"
-        policies_text += "```json\n"
-        policies_text += json.dumps({
-            "displayName": "FSI: Admins Require Compliant Device",
-            "state": "enabled",
-            "conditions": {
-                "users": {
-                    "includeRoles": [
-                        "Global Administrator",
-                        "Security Administrator",
-                        "Privileged Role Administrator"
-                    ]
-                },
-                "applications": {
-                    "includeApplications": ["All"]
-                }
-            },
-            "grantControls": {
-                "operator": "AND",
-                "builtInControls": ["mfa", "compliantDevice"]
-            }
-        }, indent=2)
-        policies_text += "\n```\n\n"
-
-        policies_text += "## Policy 4: Block Legacy Authentication\n\n"
-        policies_text += "```json\n"
-        policies_text += json.dumps({
-            "displayName": "FSI: Block Legacy Authentication",
-            "state": "enabled",
-            "conditions": {
-                "users": {
-                    "includeUsers": ["All"]
-                },
-                "applications": {
-                    "includeApplications": ["All"]
-                },
-                "clientAppTypes": ["exchangeActiveSync", "other"]
-            },
-            "grantControls": {
-                "operator": "OR",
-                "builtInControls": ["block"]
-            }
-        }, indent=2)
-        policies_text += "\n```\n\n"
-
-        policies_text += "## Policy 5: Require App Protection for Mobile\n\n"
-        policies_text += "```json\n"
-        policies_text += json.dumps({
-            "displayName": "FSI: Mobile App Protection Required",
-            "state": "enabled",
-            "conditions": {
-                "users": {
-                    "includeUsers": ["All"]
-                },
-                "applications": {
-                    "includeApplications": ["Office365"]
-                },
-                "platforms": {
-                    "includePlatforms": ["iOS", "android"]
-                }
-            },
-            "grantControls": {
-                "operator": "OR",
-                "builtInControls": ["approvedApplication", "compliantApplication"]
-            }
-        }, indent=2)
-        policies_text += "\n```\n\n"
-
-        policies_text += "## Deployment via Microsoft Graph API\n\n"
-        policies_text += "```bash\n"
-        policies_text += "# Prerequisites\n"
-        policies_text += "# 1. Install Microsoft Graph PowerShell: Install-Module Microsoft.Graph\n"
-        policies_text += "# 2. Connect: Connect-MgGraph -Scopes 'Policy.ReadWrite.ConditionalAccess'\n\n"
-
-        policies_text += "# Create policy\n"
-        policies_text += "az rest --method POST \\\n"
-        policies_text += "  --uri https://graph.microsoft.com/v1.0/identity/conditionalAccess/policies \\\n"
-        policies_text += "  --body @policy.json\n"
-        policies_text += "```\n\n"
-
-        policies_text += "## Compliance Mapping\n\n"
-        policies_text += "| Policy | Regulation | Control |\n"
-        policies_text += "|--------|------------|----------|\n"
-        policies_text += "| MFA Required | PSD2, DORA | Strong Authentication |\n"
-        policies_text += "| Block Non-EU | GDPR | Data Sovereignty |\n"
-        policies_text += "| Compliant Device | ISO 27001 | Device Management |\n"
-        policies_text += "| Block Legacy Auth | CRD IV | Modern Security |\n"
-        policies_text += "| App Protection | DORA | Mobile Security |\n\n"
-
-        policies_text += "💡 Recommendations:\n"
-        policies_text += "1. Start with 'Report-only' mode\n"
-        policies_text += "2. Review sign-in logs for impact\n"
-        policies_text += "3. Enable policies gradually\n"
-        policies_text += "4. Create break-glass admin account (exclude from CA)\n"
-        policies_text += "5. Document all policies for compliance audits\n"
-
         # Get project directory (optional for this tool - only save if project is set)
         try:
             project_dir = self.get_project_dir()
             # Save policies to file
             policies_path = project_dir / "conditional-access-policies.json"
-            policies_path.parent.mkdir(parents=True, exist_ok=True)
         except ValueError:
             # Don't save file if no project name is set
-            return {
-                "content": [
-                    {"type": "text", "text": policies_text + "\n\n❌ File not saved. Please set a project name first using set_project_name tool."}
-                ]
-            }
-
-        all_policies = [
-            {
-                "displayName": "FSI: Require MFA for All Users",
-                "state": "enabled",
-                "conditions": {
-                    "users": {"includeUsers": ["All"]},
-                    "applications": {"includeApplications": ["All"]}
-                },
-                "grantControls": {
-                    "operator": "OR",
-                    "builtInControls": ["mfa"]
-                }
-            },
-            # Add other policies...
-        ]
+            return _CONDITIONAL_ACCESS_UNSAVED_RESPONSE
 
-        with open(policies_path, 'w') as f:
-            json.dump({"policies": all_policies}, f, indent=2)
+        await self._write_output(policies_path, _CONDITIONAL_ACCESS_FILE_BYTES)
 
-        policies_text += f"\n📄 Policies saved to: {policies_path}\n"
+        policies_text = _CONDITIONAL_ACCESS_TEXT + f"\n📄 Policies saved to: {policies_path}\n"
 
         return {
             "content": [
@@ -2452,187 +3037,35 @@ output bastionDnsName string = bastionPublicIP.properties.dnsSettings.fqdn
     @tool("setup_pim_roles", "Configure Privileged Identity Management (PIM) role assignments", {})
     async def setup_pim_roles(self, args):
         """Generate PIM configuration guidance."""
-        pim_text = "👑 Privileged Identity Management (PIM) Configuration\n\n"
-
-        pim_text += "## FSI Required Roles for PIM\n\n"
-
-        pim_text += "### Azure AD Roles (Entra ID)\n"
-        pim_text += "```\n"
-        pim_text += "Critical Roles (Require PIM + Approval):\n"
-        pim_text += "   • Global Administrator\n"
-        pim_text += "   • Privileged Role Administrator\n"
-        pim_text += "   • Security Administrator\n"
-        pim_text += "   • Conditional Access Administrator\n\n"
-
-        pim_text += "Important Roles (Require PIM):\n"
-        pim_text += "   • User Administrator\n"
-        pim_text += "   • Authentication Administrator\n"
-        pim_text += "   • Exchange Administrator\n"
-        pim_text += "```\n\n"
-
-        pim_text += "### Azure Resource Roles (Subscription)\n"
-        pim_text += "```\n"
-        pim_text += "Critical Roles (Require PIM + Approval):\n"
-        pim_text += "   • Owner\n"
-        pim_text += "   • User Access Administrator\n\n"
-
-        pim_text += "Important Roles (Require PIM):\n"
-        pim_text += "   • Contributor\n"
-        pim_text += "   • Security Admin\n"
-        pim_text += "   • Network Contributor\n"
-        pim_text += "```\n\n"
-
-        pim_text += "## PIM Settings for FSI Compliance\n\n"
-
-        pim_text += "### Activation Settings\n"
-        pim_text += "```yaml\n"
-        pim_text += "activation:\n"
-        pim_text += "  require_mfa: true\n"
-        pim_text += "  require_justification: true\n"
-        pim_text += "  require_ticket_info: true\n"
-        pim_text += "  max_duration_hours: 8\n"
-        pim_text += "  require_approval: true  # For critical roles\n"
-        pim_text += "```\n\n"
-
-        pim_text += "### Assignment Settings\n"
-        pim_text += "```yaml\n"
-        pim_text += "assignment:\n"
-        pim_text += "  allow_permanent_eligible: false\n"
-        pim_text += "  allow_permanent_active: false\n"
-        pim_text += "  max_eligible_duration_days: 365\n"
-        pim_text += "  max_active_duration_days: 0  # No permanent assignments\n"
-        pim_text += "```\n\n"
-
-        pim_text += "### Notification Settings\n"
-        pim_text += "```yaml\n"
-        pim_text += "notifications:\n"
-        pim_text += "  send_on_activation: true\n"
-        pim_text += "  send_on_approval_request: true\n"
-        pim_text += "  send_to:\n"
-        pim_text += "    - security-team@company.com\n"
-        pim_text += "    - compliance@company.com\n"
-        pim_text += "```\n\n"
-
-        pim_text += "## Configuration via PowerShell\n\n"
-        pim_text += "```powershell\n"
-        pim_text += "# Install PIM module\n"
-        pim_text += "Install-Module -Name Microsoft.Graph.Identity.Governance\n\n"
-
-        pim_text += "# Connect\n"
-        pim_text += "Connect-MgGraph -Scopes 'RoleManagement.ReadWrite.Directory'\n\n"
-
-        pim_text += "# Get role definition\n"
-        pim_text += "$role = Get-MgRoleManagementDirectoryRoleDefinition -Filter \"displayName eq 'Global Administrator'\"\n\n"
-
-        pim_text += "# Configure role settings\n"
-        pim_text += "$params = @{\n"
-        pim_text += "  '@odata.type' = '#microsoft.graph.unifiedRoleManagementPolicyRule'\n"
-        pim_text += "  id = 'Approval_EndUser_Assignment'\n"
-        pim_text += "  setting = @{\n"
-        pim_text += "    isApprovalRequired = $true\n"
-        pim_text += "    approvalMode = 'SingleStage'\n"
-        pim_text += "    approvalStages = @(\n"
-        pim_text += "      @{\n"
-        pim_text += "        approvalStageTimeOutInDays = 1\n"
-        pim_text += "        isApproverJustificationRequired = $true\n"
-        pim_text += "      }\n"
-        pim_text += "    )\n"
-        pim_text += "  }\n"
-        pim_text += "}\n\n"
-
-        pim_text += "# Create eligible assignment\n"
-        pim_text += "$assignment = @{\n"
-        pim_text += "  '@odata.type' = '#microsoft.graph.unifiedRoleEligibilityScheduleRequest'\n"
-        pim_text += "  action = 'adminAssign'\n"
-        pim_text += "  principalId = '<user-object-id>'\n"
-        pim_text += "  roleDefinitionId = $role.Id\n"
-        pim_text += "  directoryScopeId = '/'\n"
-        pim_text += "  scheduleInfo = @{\n"
-        pim_text += "    startDateTime = Get-Date\n"
-        pim_text += "    expiration = @{\n"
-        pim_text += "      type = 'afterDuration'\n"
-        pim_text += "      duration = 'P365D'\n"
-        pim_text += "    }\n"
-        pim_text += "  }\n"
-        pim_text += "}\n\n"
-
-        pim_text += "New-MgRoleManagementDirectoryRoleEligibilityScheduleRequest -BodyParameter $assignment\n"
-        pim_text += "```\n\n"
-
-        pim_text += "## Break-Glass Account Setup\n\n"
-        pim_text += "⚠️  Critical: Create emergency access accounts\n\n"
-        pim_text += "Requirements:\n"
-        pim_text += "   • 2 cloud-only accounts (not synced from AD)\n"
-        pim_text += "   • Strong, randomly generated passwords (stored securely)\n"
-        pim_text += "   • Permanent Global Administrator role\n"
-        pim_text += "   • Excluded from Conditional Access policies\n"
-        pim_text += "   • Excluded from MFA requirements\n"
-        pim_text += "   • Monitored for any sign-in activity\n\n"
-
-        pim_text += "```bash\n"
-        pim_text += "# Create break-glass account\n"
-        pim_text += "az ad user create \\\n"
-        pim_text += "  --display-name 'Break Glass Account 1' \\\n"
-        pim_text += "  --user-principal-name breakglass1@yourdomain.onmicrosoft.com \\\n"
-        pim_text += "  --password '<strong-random-password>'\n"
-        pim_text += "```\n\n"
-
-        pim_text += "## Compliance Mapping\n\n"
-        pim_text += "🏛️  DORA:\n"
-        pim_text += "   • PIM = Privileged access management\n"
-        pim_text += "   • Approval workflows = Change control\n\n"
-
-        pim_text += "🏛️  ISO 27001:\n"
-        pim_text += "   • PIM = Access control (A.9.2.3)\n"
-        pim_text += "   • Time-limited access = Least privilege\n\n"
-
-        pim_text += "🏛️  NIS2:\n"
-        pim_text += "   • PIM = Risk management for admin access\n"
-        pim_text += "   • MFA on activation = Strong authentication\n\n"
-
-        pim_text += "## Audit and Monitoring\n\n"
-        pim_text += "```bash\n"
-        pim_text += "# Export PIM audit logs\n"
-        pim_text += "az monitor activity-log list \\\n"
-        pim_text += "  --resource-group <rg-name> \\\n"
-        pim_text += "  --caller 'PIMService' \\\n"
-        pim_text += "  --output table\n"
-        pim_text += "```\n\n"
-
-        pim_text += "💡 Next Steps:\n"
-        pim_text += "1. Identify privileged roles in your organization\n"
-        pim_text += "2. Enable PIM for Azure AD roles\n"
-        pim_text += "3. Enable PIM for Azure resource roles\n"
-        pim_text += "4. Configure activation settings (MFA, approval)\n"
-        pim_text += "5. Assign eligible users (no permanent assignments)\n"
-        pim_text += "6. Create break-glass accounts\n"
-        pim_text += "7. Set up monitoring and alerts for PIM activations\n"
-
-        return {
-            "content": [
-                {"type": "text", "text": pim_text}
-            ]
-        }
+        return _PIM_CONFIG_RESPONSE
 
-    def _generate_json_plan(self) -> str:
+    def _generate_json_plan(self, now: Optional[datetime] = None) -> str:
         """Generate JSON deployment plan."""
+        now = now or datetime.now()
+        if self._json_plan_body is None:
+            self._json_plan_body = self._serialize_json_plan_body()
+
+        # Splice the timestamp in as the first key of the cached document
+        return '{\n  "generated": ' + json.dumps(now.isoformat()) + ',\n' + self._json_plan_body[2:]
+
+    def _serialize_json_plan_body(self) -> str:
+        """Serialize the config-derived part of the JSON plan (all keys but 'generated')."""
         plan = {
-            "generated": datetime.now().isoformat(),
             "version": "1.0.0",
             "name": "Azure FSI Landing Zone",
             "configuration": {
                 "subscription_id": self.azure_config.get('subscription_id'),
                 "tenant_id": self.azure_config.get('tenant_id'),
-                "region": self.azure_config.get('landing_zone', {}).get('default_region'),
-                "environment": self.azure_config.get('landing_zone', {}).get('environment'),
-                "naming_prefix": self.azure_config.get('landing_zone', {}).get('naming_prefix')
+                "region": self._landing_zone.get('default_region'),
+                "environment": self._landing_zone.get('environment'),
+                "naming_prefix": self._landing_zone.get('naming_prefix')
             },
             "compliance": {
                 "regulations": self.compliance_config.get('regulations', []),
                 "policy_initiatives": self.compliance_config.get('policy_initiatives', []),
-                "custom_policies": self.compliance_config.get('custom_policies', {})
+                "custom_policies": self._custom_policies
             },
-            "architecture": self.azure_config.get('architecture', {}),
+            "architecture": self._arch_config,
             "avm_modules": [],
             "deployment_steps": [
                 "Prerequisites Check",
@@ -2807,6 +3240,47 @@ output bastionDnsName string = bastionPublicIP.properties.dnsSettings.fqdn
         }
 
 
+# Startup banners printed by main(), assembled once
+_BANNER_RULE = "=" * 80
+_BANNER_CAPABILITIES = (
+    f"{_BANNER_RULE}\n"
+    "\n🎯 Capabilities:\n"
+    "   • Deploy Microsoft FSI Landing Zone templates\n"
+    "   • Use Azure Verified Modules (AVM)\n"
+    "   • Apply European compliance policies (GDPR, DORA, PSD2, MiFID II)\n"
+    "   • Generate Bicep/Terraform templates\n"
+    "   • Validate deployments and security posture\n"
+)
+_BANNER_SUGGESTIONS = (
+    "\n💬 Try asking me to:\n"
+    "   - Set a project name (required before generating files)\n"
+    "   - Check Azure prerequisites\n"
+    "   - List FSI compliance requirements\n"
+    "   - Generate a hub VNet template\n"
+    "   - Check data residency compliance\n"
+    "   - Export a deployment plan\n"
+    "   - Validate my Azure authentication\n"
+)
+_BANNER = (
+    f"\n{_BANNER_RULE}\n"
+    "  🏦 AZURE FSI LANDING ZONE DEPLOYMENT AGENT\n"
+    + _BANNER_CAPABILITIES
+    + _BANNER_SUGGESTIONS
+)
+_SQUAD_BANNER = (
+    f"\n{_BANNER_RULE}\n"
+    "  🏦 AZURE FSI LANDING ZONE DEPLOYMENT AGENT\n"
+    "  🤖 SQUAD MODE: Multi-Agent Collaboration Enabled\n"
+    + _BANNER_CAPABILITIES
+    + "\n🤖 Squad Mode Features:\n"
+    "   • 🏗️  Architect Agent: Holistic design and recommendations\n"
+    "   • 🚀 DevOps Agent: CI/CD pipelines and automation\n"
+    "   • 🔒 Security Agent: Security posture and compliance\n"
+    "   • 🌐 Network Agent: Network design and connectivity\n"
+    + _BANNER_SUGGESTIONS
+)
+
+
 async def main():
     """
     Main entry point for the Azure FSI Landing Zone agent.
@@ -2842,33 +3316,7 @@ Examples:
     # Create and run the agent
     agent = AzureFSILandingZoneAgent(config_dir, squad_mode=args.squad)
 
-    print("\n" + "="*80)
-    print("  🏦 AZURE FSI LANDING ZONE DEPLOYMENT AGENT")
-    if args.squad:
-        print("  🤖 SQUAD MODE: Multi-Agent Collaboration Enabled")
-    print("="*80)
-    print("\n🎯 Capabilities:")
-    print("   • Deploy Microsoft FSI Landing Zone templates")
-    print("   • Use Azure Verified Modules (AVM)")
-    print("   • Apply European compliance policies (GDPR, DORA, PSD2, MiFID II)")
-    print("   • Generate Bicep/Terraform templates")
-    print("   • Validate deployments and security posture")
-
-    if args.squad:
-        print("\n🤖 Squad Mode Features:")
-        print("   • 🏗️  Architect Agent: Holistic design and recommendations")
-        print("   • 🚀 DevOps Agent: CI/CD pipelines and automation")
-        print("   • 🔒 Security Agent: Security posture and compliance")
-        print("   • 🌐 Network Agent: Network design and connectivity")
-
-    print("\n💬 Try asking me to:")
-    print("   - Set a project name (required before generating files)")
-    print("   - Check Azure prerequisites")
-    print("   - List FSI compliance requirements")
-    print("   - Generate a hub VNet template")
-    print("   - Check data residency compliance")
-    print("   - Export a deployment plan")
-    print("   - Validate my Azure authentication")
+    sys.stdout.write(_SQUAD_BANNER if args.squad else _BANNER)
 
     await agent.run_interactive()
 
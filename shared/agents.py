@@ -86,14 +86,14 @@ class BaseClaudeAgent:
             )
             mcp_servers['agent_tools'] = server
         
-        # Build allowed tools list
-        allowed_tools = self.agent_config.get('allowed_tools', [])
+        # Build allowed tools list (a copy, so repeated calls don't grow the config)
+        allowed_tools = list(self.agent_config.get('allowed_tools', []))
         if custom_tools:
             # Add MCP tool names for custom tools
-            for tool_obj in custom_tools:
-                # SdkMcpTool objects have a 'name' attribute
-                tool_name = f"mcp__agent_tools__{tool_obj.name}"
-                allowed_tools.append(tool_name)
+            # SdkMcpTool objects have a 'name' attribute
+            allowed_tools.extend(
+                f"mcp__agent_tools__{tool_obj.name}" for tool_obj in custom_tools
+            )
         
         return ClaudeAgentOptions(
             system_prompt=self.get_system_prompt(),
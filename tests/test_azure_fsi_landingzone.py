@@ -0,0 +1,55 @@
+"""
+Tests for the Azure FSI Landing Zone agent's MCP tool schemas.
+"""
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+repo_root = Path(__file__).parent.parent
+agent_dir = repo_root / "agents" / "azure-fsi-landingzone"
+
+# Every agent directory has an agent.py, so load this one under a unique module name
+_spec = importlib.util.spec_from_file_location("azure_fsi_landingzone_agent", agent_dir / "agent.py")
+agent_module = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = agent_module
+_spec.loader.exec_module(agent_module)
+AzureFSILandingZoneAgent = agent_module.AzureFSILandingZoneAgent
+
+mcp = pytest.importorskip("mcp")
+if not hasattr(mcp, "Client"):
+    pytest.skip("in-process MCP client requires mcp 2.x", allow_module_level=True)
+
+
+def _advertised_schemas():
+    """Build the agent's SDK MCP server and return each tool's advertised input schema."""
+    agent = AzureFSILandingZoneAgent(agent_dir)
+    server = agent.get_agent_options().mcp_servers['agent_tools']['instance']
+
+    async def list_tools():
+        async with mcp.Client(server) as client:
+            result = await client.list_tools()
+            return {t.name: t.input_schema for t in result.tools}
+
+    return asyncio.run(list_tools())
+
+
+class TestCheckAzurePrerequisitesSchema:
+    """check_azure_prerequisites must stay callable without arguments."""
+
+    def test_accepts_empty_arguments(self):
+        """The optional 'force' flag must not be required."""
+        schema = _advertised_schemas()['check_azure_prerequisites']
+        jsonschema.validate(instance={}, schema=schema)
+
+    def test_accepts_force_flag(self):
+        """force=true is accepted and must be a boolean."""
+        schema = _advertised_schemas()['check_azure_prerequisites']
+        jsonschema.validate(instance={"force": True}, schema=schema)
+        with pytest.raises(jsonschema.ValidationError):
+            jsonschema.validate(instance={"force": "yes"}, schema=schema)
+